@@ -20,6 +20,10 @@ import sys
 import time
 import argparse
 import os
+import queue
+import threading
+
+import numpy as np
 
 # Add src to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -28,14 +32,14 @@ src_dir = os.path.join(project_root, 'src')
 sys.path.insert(0, src_dir)
 
 try:
-    from rpi_ws281x import PixelStrip, Color
+    from rpi_ws281x import PixelStrip
     HAS_HARDWARE = True
 except ImportError:
     print("Warning: rpi_ws281x not available. Running in console mode only.")
     HAS_HARDWARE = False
 
 from personality.pixel_art import (
-    EXPRESSIONS, ICONS, ColorPalette,
+    EXPRESSIONS, ICONS, ALL_PATTERNS, ColorPalette, CONSOLE_CHARS,
     get_colored_pattern, visualize_pattern
 )
 from personality.animations import PixelAnimator
@@ -49,6 +53,33 @@ LED_BRIGHTNESS = 80   # Brightness (0-255)
 LED_INVERT = False
 LED_CHANNEL = 0
 
+# Default palette for each pattern when shown on its own
+PALETTE_BY_NAME = {
+    'happy': ColorPalette.HAPPY,
+    'very_happy': ColorPalette.HAPPY,
+    'walking': ColorPalette.HAPPY,
+    'stretching': ColorPalette.HAPPY,
+    'concerned': ColorPalette.CONCERNED,
+    'worried': ColorPalette.WORRIED,
+    'sleeping': ColorPalette.SLEEPING,
+    'sleeping_zzz': ColorPalette.SLEEPING,
+    'heart': ColorPalette.LOVE,
+    'water': ColorPalette.HYDRATION,
+    'check': ColorPalette.SUCCESS,
+    'sparkle': ColorPalette.SUCCESS,
+    'exclamation': ColorPalette.ALERT,
+}
+
+# Cursor position of the first frame row, below the title and rule
+FRAME_ORIGIN = '\033[3;1H'
+
+
+def render_console_frame(frame):
+    """Render an 8x8 pattern as a single newline-joined string."""
+    return '\n'.join(
+        bytes(row).decode('latin1').translate(CONSOLE_CHARS) for row in frame
+    )
+
 
 def xy_to_index(x, y, width=8):
     """
@@ -61,6 +92,109 @@ def xy_to_index(x, y, width=8):
         return y * width + (width - 1 - x)
 
 
+# Strip index for each pixel in row-major order: INDEX_LUT[y * 8 + x].
+# Use this in hot paths; xy_to_index remains for non-8-wide layouts.
+INDEX_LUT = bytes(xy_to_index(i % 8, i // 8) for i in range(LED_COUNT))
+SERPENTINE = np.frombuffer(INDEX_LUT, dtype=np.uint8).astype(np.intp)
+
+
+def pack_colored_array(colored):
+    """
+    Pack an RGB image into WS2812B color words in strip order.
+
+    Args:
+        colored: 8x8x3 array-like of RGB values
+
+    Returns:
+        List of 64 packed GRB integers, indexed by strip position
+    """
+    arr = np.asarray(colored, dtype=np.uint32).reshape(LED_COUNT, 3)
+
+    # Note: WS2812B uses GRB order, not RGB
+    packed = (arr[:, 1] << 16) | (arr[:, 0] << 8) | arr[:, 2]
+
+    # Reorder into strip order using the serpentine lookup
+    out = np.empty(LED_COUNT, dtype=np.uint32)
+    out[SERPENTINE] = packed
+    return out.tolist()
+
+
+def write_packed(strip, packed):
+    """Write a packed frame to the strip and transmit it."""
+    for i, c in enumerate(packed):
+        strip.setPixelColor(i, c)
+    strip.show()
+
+
+def display_colored_array(strip, colored):
+    """
+    Push an already-colored image to the LED matrix.
+
+    Args:
+        strip: PixelStrip object
+        colored: 8x8x3 array-like of RGB values
+    """
+    write_packed(strip, pack_colored_array(colored))
+
+
+class StripWriter:
+    """
+    Background writer that transmits packed frames to the strip.
+
+    Lets the caller prepare the next frame while the current one is
+    being sent. The queue holds two frames, so put() applies
+    backpressure when the strip falls behind. If a write fails, the
+    error is raised from the next put() or close().
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(self, strip):
+        self.strip = strip
+        self.frames = queue.Queue(maxsize=2)
+        self.error = None
+        self._error_raised = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                packed = self.frames.get()
+                if packed is None:
+                    break
+                write_packed(self.strip, packed)
+        except Exception as e:
+            self.error = e
+
+    def _check(self):
+        """Re-raise a write error from the writer thread (once)."""
+        if self.error is not None and not self._error_raised:
+            self._error_raised = True
+            raise RuntimeError(f"LED strip write failed: {self.error}") from self.error
+
+    def _put(self, item):
+        """Queue an item, giving up if the writer thread has died."""
+        while self.thread.is_alive():
+            try:
+                self.frames.put(item, timeout=self.POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def put(self, packed):
+        """Queue a packed frame, blocking while both slots are full."""
+        if not self._put(packed):
+            self._check()
+
+    def close(self):
+        """Drain queued frames and stop the writer thread."""
+        if self._put(None):
+            self.thread.join()
+        self._check()
+
+
 def display_pattern_on_matrix(strip, pattern, palette):
     """
     Display a colored pattern on the LED matrix.
@@ -70,22 +204,16 @@ def display_pattern_on_matrix(strip, pattern, palette):
         pattern: 8x8 pattern list
         palette: ColorPalette dictionary
     """
-    colored = get_colored_pattern(pattern, palette)
+    display_colored_array(strip, get_colored_pattern(pattern, palette))
 
-    for y in range(8):
-        for x in range(8):
-            r, g, b = colored[y][x]
-            idx = xy_to_index(x, y)
-            # Note: WS2812B uses GRB order, not RGB
-            strip.setPixelColor(idx, Color(g, r, b))
 
-    strip.show()
+BLANK_FRAME = [0] * LED_COUNT
 
 
 def clear_matrix(strip):
     """Turn off all LEDs."""
-    for i in range(LED_COUNT):
-        strip.setPixelColor(i, Color(0, 0, 0))
+    # Bulk-assign the LED buffer rather than building Color(0, 0, 0) per pixel
+    strip.getPixels()[:] = BLANK_FRAME
     strip.show()
 
 
@@ -100,23 +228,59 @@ def breathing_effect(strip, pattern, palette, duration=3.0, steps=30):
         duration: Total duration in seconds
         steps: Number of brightness steps
     """
+    breathing_colored_array(
+        strip, get_colored_pattern(pattern, palette), duration, steps
+    )
+
+
+def breathing_colored_array(strip, colored, duration=3.0, steps=30):
+    """
+    Display an already-colored image with breathing brightness effect.
+
+    Args:
+        strip: PixelStrip object
+        colored: 8x8x3 array-like of RGB values
+        duration: Total duration in seconds
+        steps: Number of brightness steps
+    """
     import math
 
-    for step in range(steps):
-        # Calculate brightness using sine wave (0 to 1)
-        brightness = (math.sin(2 * math.pi * step / steps) + 1) / 2
+    # Only the brightness changes per step
+    base = np.asarray(colored, dtype=np.float32)
+
+    # Calculate brightness using sine wave (0 to 1). The curve is
+    # symmetric, so frames are cached by brightness and each distinct
+    # level is only scaled and packed once.
+    brightness_table = [
+        round((math.sin(2 * math.pi * step / steps) + 1) / 2, 6)
+        for step in range(steps)
+    ]
+    frame_cache = {}
 
-        # Create scaled palette
-        scaled_palette = {}
-        for key, (r, g, b) in palette.items():
-            scaled_palette[key] = (
-                int(r * brightness),
-                int(g * brightness),
-                int(b * brightness)
-            )
+    # Schedule against absolute deadlines so sleep overshoot doesn't drift
+    dt = duration / steps
+    t0 = time.monotonic()
 
-        display_pattern_on_matrix(strip, pattern, scaled_palette)
-        time.sleep(duration / steps)
+    # Transmit on a background thread while the next frame is prepared
+    writer = StripWriter(strip)
+    try:
+        for step in range(steps):
+            target = t0 + (step + 1) * dt
+            if time.monotonic() >= target:
+                continue  # Behind schedule - drop this frame
+
+            brightness = brightness_table[step]
+            packed = frame_cache.get(brightness)
+            if packed is None:
+                scaled = (base * brightness).astype(np.uint8)
+                packed = frame_cache[brightness] = pack_colored_array(scaled)
+            writer.put(packed)
+
+            remaining = target - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+    finally:
+        writer.close()
 
 
 def console_demo(animated=False, animation_style='cascade'):
@@ -173,10 +337,8 @@ def console_demo(animated=False, animation_style='cascade'):
 
         try:
             for name, pattern in demo_patterns:
-                # Clear screen and show title
-                print('\033[2J\033[H', end='')
-                print(f"🌿 {name}")
-                print("-" * 50)
+                # Clear screen and show title (once per transition)
+                sys.stdout.write(f"\033[2J\033[H🌿 {name}\n" + "-" * 50 + "\n")
 
                 # Animate transition
                 for frame in animator.transition(
@@ -186,14 +348,12 @@ def console_demo(animated=False, animation_style='cascade'):
                     fall_steps=8,
                     rise_steps=10
                 ):
-                    # Move cursor up to redraw
-                    if current_pattern is not None:
-                        print('\033[10A', end='')
-
-                    chars = {0: ' ', 1: '█', 2: '▓', 3: '░'}
-                    for row in frame:
-                        print(''.join(chars.get(p, '?') for p in row))
-                    print()
+                    # Jump to the line below the title and redraw in place,
+                    # so each frame is a single write with no flicker
+                    sys.stdout.write(
+                        FRAME_ORIGIN + render_console_frame(frame) + '\n\n'
+                    )
+                    sys.stdout.flush()
 
                 current_pattern = pattern
                 time.sleep(1.5)  # Hold final state
@@ -206,6 +366,59 @@ def console_demo(animated=False, animation_style='cascade'):
             print("=" * 50)
 
 
+# Full demo: (pattern name, (palette, effect))
+DEMO_SEQUENCE = [
+    # Expressions with moods
+    ('happy', (ColorPalette.HAPPY, "breathing")),
+    ('very_happy', (ColorPalette.CELEBRATING, "static")),
+    ('thinking', (ColorPalette.NEUTRAL, "static")),
+    ('concerned', (ColorPalette.CONCERNED, "breathing")),
+    ('worried', (ColorPalette.WORRIED, "breathing")),
+    ('sleeping', (ColorPalette.SLEEPING, "breathing")),
+    ('sleeping_zzz', (ColorPalette.SLEEPING, "static")),
+
+    # Icons
+    ('heart', (ColorPalette.LOVE, "breathing")),
+    ('water', (ColorPalette.HYDRATION, "static")),
+    ('check', (ColorPalette.SUCCESS, "static")),
+    ('walking', (ColorPalette.HAPPY, "static")),
+    ('stretching', (ColorPalette.HAPPY, "static")),
+    ('exclamation', (ColorPalette.ALERT, "static")),
+    ('sparkle', (ColorPalette.CELEBRATING, "static")),
+]
+
+
+def demo_sequence_gen(demo_sequence):
+    """
+    Lazily prepare each demo item for display.
+
+    Args:
+        demo_sequence: List of (name, (palette, effect)) pairs; a None
+            config auto-selects the palette and uses breathing
+
+    Yields:
+        (name, colored 8x8x3 uint8 array, effect) tuples
+    """
+    for name, config in demo_sequence:
+        # Get pattern
+        if name not in ALL_PATTERNS:
+            print(f"❌ Pattern '{name}' not found")
+            continue
+
+        pattern = ALL_PATTERNS[name]
+
+        # Determine palette and effect
+        if config:
+            palette, effect = config
+        else:
+            # Auto-select palette based on pattern type
+            palette = PALETTE_BY_NAME.get(name, ColorPalette.NEUTRAL)
+            effect = "breathing"
+
+        colored = np.asarray(get_colored_pattern(pattern, palette), dtype=np.uint8)
+        yield name, colored, effect
+
+
 def hardware_demo(pattern_name=None):
     """Run hardware demo on LED matrix."""
     if not HAS_HARDWARE:
@@ -221,83 +434,28 @@ def hardware_demo(pattern_name=None):
     print("\n🌿 Pixel Plant Pattern Demo")
     print("=" * 50)
 
-    try:
-        if pattern_name:
-            # Display specific pattern
-            demo_sequence = [(pattern_name, None)]
-        else:
-            # Display all patterns in sequence
-            demo_sequence = [
-                # Expressions with moods
-                ('happy', (ColorPalette.HAPPY, "breathing")),
-                ('very_happy', (ColorPalette.CELEBRATING, "static")),
-                ('thinking', (ColorPalette.NEUTRAL, "static")),
-                ('concerned', (ColorPalette.CONCERNED, "breathing")),
-                ('worried', (ColorPalette.WORRIED, "breathing")),
-                ('sleeping', (ColorPalette.SLEEPING, "breathing")),
-                ('sleeping_zzz', (ColorPalette.SLEEPING, "static")),
-
-                # Icons
-                ('heart', (ColorPalette.LOVE, "breathing")),
-                ('water', (ColorPalette.HYDRATION, "static")),
-                ('check', (ColorPalette.SUCCESS, "static")),
-                ('walking', (ColorPalette.HAPPY, "static")),
-                ('stretching', (ColorPalette.HAPPY, "static")),
-                ('exclamation', (ColorPalette.ALERT, "static")),
-                ('sparkle', (ColorPalette.CELEBRATING, "static")),
-            ]
-
-        for item in demo_sequence:
-            if len(item) == 2:
-                name, config = item
-            else:
-                name = item
-                config = None
-
-            # Get pattern
-            all_patterns = {**EXPRESSIONS, **ICONS}
-            if name not in all_patterns:
-                print(f"❌ Pattern '{name}' not found")
-                continue
+    items = demo_sequence_gen([(pattern_name, None)] if pattern_name else DEMO_SEQUENCE)
 
-            pattern = all_patterns[name]
-
-            # Determine palette and effect
-            if config:
-                palette, effect = config
-            else:
-                # Auto-select palette based on pattern type
-                if name in ['happy', 'very_happy', 'walking', 'stretching']:
-                    palette = ColorPalette.HAPPY
-                elif name == 'concerned':
-                    palette = ColorPalette.CONCERNED
-                elif name == 'worried':
-                    palette = ColorPalette.WORRIED
-                elif name in ['sleeping', 'sleeping_zzz']:
-                    palette = ColorPalette.SLEEPING
-                elif name == 'heart':
-                    palette = ColorPalette.LOVE
-                elif name == 'water':
-                    palette = ColorPalette.HYDRATION
-                elif name in ['check', 'sparkle']:
-                    palette = ColorPalette.SUCCESS
-                elif name == 'exclamation':
-                    palette = ColorPalette.ALERT
-                else:
-                    palette = ColorPalette.NEUTRAL
-                effect = "breathing"
+    try:
+        item = next(items, None)
+        while item is not None:
+            name, colored, effect = item
 
             print(f"\n✨ Displaying: {name.upper().replace('_', ' ')}")
 
             if effect == "breathing":
-                breathing_effect(strip, pattern, palette, duration=3.0)
+                breathing_colored_array(strip, colored, duration=3.0)
             else:
-                display_pattern_on_matrix(strip, pattern, palette)
+                display_colored_array(strip, colored)
                 time.sleep(2.0)
 
-            # Brief pause between patterns
+            # Brief pause between patterns, preparing the next one meanwhile
             clear_matrix(strip)
-            time.sleep(0.5)
+            pause_end = time.monotonic() + 0.5
+            item = next(items, None)
+            remaining = pause_end - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
         print("\n✅ Demo complete!")
 
@@ -305,6 +463,8 @@ def hardware_demo(pattern_name=None):
         print("\n\n⚠️  Demo interrupted by user")
 
     finally:
+        items.close()
+
         # Clean up: turn off all LEDs
         clear_matrix(strip)
         print("🔌 Matrix cleared\n")
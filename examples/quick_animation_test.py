@@ -7,6 +7,7 @@ Run this to see pixels rising and falling between patterns!
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14,32 +15,25 @@ project_root = os.path.dirname(script_dir)
 src_dir = os.path.join(project_root, 'src')
 sys.path.insert(0, src_dir)
 
-from personality.pixel_art import HAPPY_FACE, HEART, WATER_DROP, CONCERNED_FACE
+from personality.pixel_art import HAPPY_FACE, HEART, WATER_DROP, CONCERNED_FACE, CONSOLE_CHARS
 from personality.animations import PixelAnimator
 
+
 def clear_and_print(pattern, title=""):
     """Clear screen and print pattern."""
-    print('\033[2J\033[H', end='')  # Clear screen
+    buf = '\033[2J\033[H'  # Clear screen
     if title:
-        print(f"🌿 {title}")
-        print("-" * 30)
+        buf += f"🌿 {title}\n" + "-" * 30 + "\n"
 
-    chars = {0: ' ', 1: '█', 2: '▓', 3: '░'}
-    for row in pattern:
-        print('  ' + ''.join(chars.get(p, '?') for p in row))
-    print()
+    buf += ''.join(
+        '  ' + bytes(row).decode('latin1').translate(CONSOLE_CHARS) + '\n'
+        for row in pattern
+    )
+    sys.stdout.write(buf + '\n')
+    sys.stdout.flush()
 
 def demo_style(style_name):
     """Demo a specific animation style."""
-    print('\033[2J\033[H')
-    print(f"\n{'='*50}")
-    print(f"  PIXEL RISE & FALL DEMO - {style_name.upper()}")
-    print(f"{'='*50}\n")
-    print("  Watch the pixels rise from the base to form each image,")
-    print("  then fall and rise again for the next pattern!\n")
-    print("  (Just like in Becky Chambers' novel!)\n")
-    time.sleep(3)
-
     animator = PixelAnimator()
 
     patterns = [
@@ -49,15 +43,63 @@ def demo_style(style_name):
         ("Concerned Face", CONCERNED_FACE),
     ]
 
-    current = None
+    def render_transition(from_pattern, to_pattern):
+        """Collect (frame, pause) pairs; pause is the animator's own delay
+        after the frame, so playback keeps the animator's pacing"""
+        frames = []
+        last = time.monotonic()
+        for frame in animator.transition(from_pattern, to_pattern, style=style_name,
+                                         fall_steps=6, rise_steps=8):
+            now = time.monotonic()
+            if frames:
+                frames[-1][1] = now - last
+            frames.append([frame, 0.0])
+            last = now
+        frames[-1][1] = time.monotonic() - last
+        return frames
+
+    # PixelAnimator holds no per-transition state, so the next transition
+    # can be rendered in the background while the current image is held
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = executor.submit(render_transition, None, patterns[0][1])
 
-    for name, pattern in patterns:
-        for frame in animator.transition(current, pattern, style=style_name, fall_steps=6, rise_steps=8):
-            clear_and_print(frame, name)
-            time.sleep(0.08)
+    print('\033[2J\033[H')
+    print(f"\n{'='*50}")
+    print(f"  PIXEL RISE & FALL DEMO - {style_name.upper()}")
+    print(f"{'='*50}\n")
+    print("  Watch the pixels rise from the base to form each image,")
+    print("  then fall and rise again for the next pattern!\n")
+    print("  (Just like in Becky Chambers' novel!)\n")
+    time.sleep(3)
 
-        current = pattern
-        time.sleep(1.2)  # Hold
+    frame_delay = 0.08
+
+    try:
+        for i, (name, pattern) in enumerate(patterns):
+            frames = pending.result()
+            if i + 1 < len(patterns):
+                pending = executor.submit(render_transition, pattern, patterns[i + 1][1])
+
+            # Pace frames against absolute deadlines to avoid cumulative drift
+            next_frame = time.monotonic()
+            last_frame = None  # Title changes per pattern, so always draw the first frame
+            for frame, pause in frames:
+                # Skip redrawing frames identical to the one on screen
+                snapshot = tuple(tuple(row) for row in frame)
+                if snapshot != last_frame:
+                    clear_and_print(frame, name)
+                    last_frame = snapshot
+
+                next_frame += frame_delay + pause
+                remaining = next_frame - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    next_frame = time.monotonic()  # Fell behind - resync
+
+            time.sleep(1.2)  # Hold
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     print("\n  ✨ Animation complete!")
     print(f"  {'='*50}\n")
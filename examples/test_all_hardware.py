@@ -6,14 +6,23 @@ Tests all Pixel Plant hardware components
 
 import sys
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import numpy as np
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 from hardware import LEDMatrix, AudioSystem, CameraSystem, MotionSensor
 from personality import get_pattern, ColorPalette
 
+BANNER = (
+    "\n╔" + "=" * 48 + "╗\n"
+    "║  PIXEL PLANT - COMPLETE HARDWARE TEST SUITE  ║\n"
+    "╚" + "=" * 48 + "╝\n"
+)
+
 
 def test_led_matrix(simulate=False):
     """Test LED matrix"""
@@ -80,8 +89,15 @@ def test_audio_system(simulate=False):
         audio.close()
 
 
-def test_camera_system(simulate=False):
-    """Test camera system"""
+def test_camera_system(simulate=False, fast=False):
+    """
+    Test camera system
+
+    Args:
+        simulate: Use a simulated camera
+        fast: Benchmark mode - capture back-to-back into a preallocated
+            buffer and report aggregate timing instead of per-frame details
+    """
     print("\n" + "=" * 50)
     print("3. CAMERA SYSTEM TEST")
     print("=" * 50)
@@ -93,6 +109,9 @@ def test_camera_system(simulate=False):
         camera.start()
         time.sleep(1)
 
+        if fast:
+            return _benchmark_camera(camera, frame_count=5)
+
         print("   Capturing 5 test frames...")
         for i in range(5):
             frame = camera.capture_frame()
@@ -114,6 +133,27 @@ def test_camera_system(simulate=False):
         camera.close()
 
 
+def _benchmark_camera(camera, frame_count):
+    """Capture frames as fast as the camera delivers them"""
+    print(f"   Benchmarking {frame_count} back-to-back frames...")
+    width, height = camera.get_frame_size()
+    frames = np.empty((frame_count, height, width, 3), dtype=np.uint8)
+
+    start = time.monotonic()
+    for i in range(frame_count):
+        frame = camera.capture_frame()
+        if frame is None:
+            print(f"      Frame {i+1}: Failed")
+            return False
+        np.copyto(frames[i], frame)
+    elapsed = time.monotonic() - start
+
+    print(f"      {frame_count} frames of {width}x{height} in {elapsed * 1000:.1f} ms "
+          f"({frame_count / elapsed:.1f} fps)")
+    print("   ✅ Camera System: PASS")
+    return True
+
+
 def test_motion_sensor(simulate=False):
     """Test PIR motion sensor"""
     print("\n" + "=" * 50)
@@ -201,11 +241,18 @@ def test_integration(simulate=False):
         camera.close()
 
 
-def run_all_tests(simulate=False):
-    """Run complete hardware validation suite"""
-    print("\n" + "╔" + "=" * 48 + "╗")
-    print("║  PIXEL PLANT - COMPLETE HARDWARE TEST SUITE  ║")
-    print("╚" + "=" * 48 + "╝")
+def run_all_tests(simulate=False, parallel=False, bench=False):
+    """
+    Run complete hardware validation suite
+
+    Args:
+        simulate: Use simulated hardware
+        parallel: Run the independent component tests concurrently.
+            The integration test always runs last, on its own, since it
+            reopens every device.
+        bench: Run the camera test in back-to-back benchmark mode
+    """
+    sys.stdout.write(BANNER)
 
     if simulate:
         print("\n⚠️  SIMULATION MODE")
@@ -216,11 +263,28 @@ def run_all_tests(simulate=False):
 
     results = {}
 
+    component_tests = [
+        ('LED Matrix', test_led_matrix),
+        ('Audio System', test_audio_system),
+        ('Camera System', partial(test_camera_system, fast=bench)),
+        ('Motion Sensor', test_motion_sensor),
+    ]
+
     # Run all tests
-    results['LED Matrix'] = test_led_matrix(simulate)
-    results['Audio System'] = test_audio_system(simulate)
-    results['Camera System'] = test_camera_system(simulate)
-    results['Motion Sensor'] = test_motion_sensor(simulate)
+    if parallel:
+        # Tests are dominated by sleeps and device waits, so overlapping
+        # them cuts wall time to roughly the slowest test
+        with ThreadPoolExecutor(max_workers=len(component_tests)) as executor:
+            futures = {
+                name: executor.submit(test, simulate)
+                for name, test in component_tests
+            }
+            for name, future in futures.items():
+                results[name] = future.result()
+    else:
+        for name, test in component_tests:
+            results[name] = test(simulate)
+
     results['Integration'] = test_integration(simulate)
 
     # Summary
@@ -257,13 +321,24 @@ if __name__ == '__main__':
         action='store_true',
         help='Test with real hardware (default: simulate)'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run component tests concurrently (output may interleave)'
+    )
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Benchmark camera capture rate instead of per-frame checks'
+    )
 
     args = parser.parse_args()
 
     simulate = not args.real
 
     try:
-        success = run_all_tests(simulate=simulate)
+        success = run_all_tests(simulate=simulate, parallel=args.parallel,
+                                bench=args.bench)
         sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
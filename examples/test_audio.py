@@ -6,14 +6,20 @@ Validates I2S audio and text-to-speech functionality
 
 import sys
 import time
-from pathlib import Path
+import os
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 from hardware import AudioSystem
 from personality import MessageLibrary, MessageType
 
+BANNER = (
+    "=" * 50 + "\n"
+    "PIXEL PLANT - Audio System Hardware Test\n"
+    + "=" * 50 + "\n"
+)
+
 
 def test_basic_speech(audio, simulate=False):
     """Test basic text-to-speech"""
@@ -60,31 +66,19 @@ def test_voice_settings(audio):
     """Test different voice settings"""
     print("\n3. Testing voice settings...")
 
-    test_phrase = "Testing different voice settings."
-
-    # Test different rates
-    print("   Testing speech rates...")
+    # Each sweep is queued with per-utterance settings and synthesized
+    # in a single engine run, so each sample names its own setting
+    print("   Testing speech rates (each sample announces its rate)...")
     rates = [100, 150, 200]
     for rate in rates:
         print(f"     Rate: {rate} WPM")
-        audio.set_rate(rate)
-        audio.speak(test_phrase, wait=True)
-        time.sleep(0.5)
+    audio.speak_batch([(f"Rate {rate} words per minute.", rate, None) for rate in rates])
 
-    # Reset to default
-    audio.set_rate(150)
-
-    # Test different volumes
-    print("   Testing volumes...")
+    print("   Testing volumes (each sample announces its volume)...")
     volumes = [50, 70, 100]
     for volume in volumes:
         print(f"     Volume: {volume}%")
-        audio.set_volume(volume)
-        audio.speak(test_phrase, wait=True)
-        time.sleep(0.5)
-
-    # Reset to default
-    audio.set_volume(70)
+    audio.speak_batch([(f"Volume {volume} percent.", None, volume) for volume in volumes])
 
     print("   ✓ Voice settings test complete")
 
@@ -148,9 +142,7 @@ def run_interactive_test(audio):
 
 def run_full_test(simulate=False):
     """Run complete audio system test suite"""
-    print("=" * 50)
-    print("PIXEL PLANT - Audio System Hardware Test")
-    print("=" * 50)
+    sys.stdout.write(BANNER)
 
     if simulate:
         print("\n⚠️  Running in SIMULATION mode")
@@ -6,13 +6,15 @@ Validates 8x8 WS2812B LED matrix functionality
 
 import sys
 import time
-from pathlib import Path
+import os
+import numpy as np
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 from hardware import LEDMatrix
 from personality import get_pattern, ColorPalette
+from personality.pixel_art import get_colored_pattern
 
 def test_basic_colors(matrix):
     """Test basic color display"""
@@ -30,7 +32,8 @@ def test_basic_colors(matrix):
 
     for name, (r, g, b) in colors:
         print(f"   {name}...")
-        pattern = [[(r, g, b) for _ in range(8)] for _ in range(8)]
+        # Zero-copy broadcast of one color to every pixel
+        pattern = np.broadcast_to(np.array([r, g, b], dtype=np.uint8), (8, 8, 3))
         matrix.show_pattern(pattern)
         time.sleep(1.5)
 
@@ -55,18 +58,15 @@ def test_individual_pixels(matrix):
     for x, y, name in corners:
         print(f"   {name} ({x}, {y})...")
         matrix.set_pixel(x, y, 0, 255, 0)  # Green
-        matrix.strip.show() if not matrix.simulate else None
+        matrix.show()
         time.sleep(0.8)
 
     matrix.clear()
 
     # Test center pixels
     print("   Center pixels...")
-    for x in range(3, 5):
-        for y in range(3, 5):
-            matrix.set_pixel(x, y, 255, 0, 0)  # Red
-
-    matrix.strip.show() if not matrix.simulate else None
+    matrix.set_region(3, 5, 3, 5, (255, 0, 0))  # Red
+    matrix.show()
     time.sleep(1.5)
     matrix.clear()
 
@@ -100,15 +100,18 @@ def test_brightness(matrix):
     """Test brightness levels"""
     print("\n4. Testing brightness levels...")
 
-    pattern = get_pattern('happy')
-    palette = ColorPalette.HAPPY
+    # Resolve the palette once; only the global brightness varies per level
+    colored = np.asarray(
+        get_colored_pattern(get_pattern('happy'), ColorPalette.HAPPY),
+        dtype=np.uint8
+    )
 
     brightness_levels = [255, 192, 128, 64, 32, 16]
 
     for brightness in brightness_levels:
         print(f"   Brightness: {brightness}/255...")
         matrix.set_brightness(brightness)
-        matrix.show_pattern(pattern, palette)
+        matrix.show_pattern(colored)
         time.sleep(1.5)
 
     # Reset to default
@@ -123,12 +126,13 @@ def test_animations(matrix):
 
     # Chasing pattern
     print("   Chase animation...")
-    for i in range(24):
-        matrix.clear()
-        x = i % 8
-        y = i // 8
-        matrix.set_pixel(x, y, 0, 255, 0)
-        matrix.strip.show() if not matrix.simulate else None
+    # Precompute every frame: one green pixel stepping along the first 3 rows
+    steps = np.arange(24)
+    frames = np.zeros((24, 8, 8, 3), dtype=np.uint8)
+    frames[steps, steps // 8, steps % 8] = (0, 255, 0)
+
+    for frame in frames:
+        matrix.push_raw(frame)
         time.sleep(0.1)
 
     # Breathing effect
@@ -6,11 +6,11 @@ Validates motion detection and sensitivity
 
 import sys
 import time
-from pathlib import Path
+import os
 from datetime import datetime, timedelta
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 from hardware import MotionSensor
 
@@ -18,22 +18,24 @@ from hardware import MotionSensor
 def test_basic_detection(sensor, duration=10):
     """Test basic motion detection"""
     print("\n1. Testing basic motion detection...")
-    print(f"   Monitoring for {duration} seconds...")
+    print(f"   Monitoring for {duration:g} seconds...")
 
     if not sensor.simulate:
         print("   Wave your hand in front of the PIR sensor!")
 
+    # Real PIR outputs stay high briefly after a trigger; simulated ones don't
+    debounce = 0.0 if sensor.simulate else 0.5
+
     detection_count = 0
-    start_time = time.time()
+    start_time = time.monotonic()
 
-    while time.time() - start_time < duration:
-        if sensor.is_motion_detected():
+    while (elapsed := time.monotonic() - start_time) < duration:
+        if sensor.wait_for_edge(timeout=min(1.0, duration - elapsed)):
             detection_count += 1
-            print(f"   [{int(time.time() - start_time)}s] Motion detected! (Count: {detection_count})")
-            time.sleep(0.5)  # Debounce
-        time.sleep(0.1)
+            print(f"   [{int(time.monotonic() - start_time)}s] Motion detected! (Count: {detection_count})")
+            time.sleep(debounce)
 
-    print(f"   ✓ Detected {detection_count} motion events in {duration}s")
+    print(f"   ✓ Detected {detection_count} motion events in {duration:g}s")
     return detection_count
 
 
@@ -92,7 +94,7 @@ def test_wait_for_motion(sensor):
 def test_continuous_monitoring(sensor, duration=30):
     """Test continuous monitoring with statistics"""
     print("\n4. Testing continuous monitoring...")
-    print(f"   Monitoring for {duration} seconds with statistics...")
+    print(f"   Monitoring for {duration:g} seconds with statistics...")
 
     if not sensor.simulate:
         print("   Move around naturally in front of the sensor!")
@@ -104,13 +106,12 @@ def test_continuous_monitoring(sensor, duration=30):
         'detection_times': [],
     }
 
-    start_time = time.time()
+    start_time = time.monotonic()
     last_detection = 0
 
-    while time.time() - start_time < duration:
-        elapsed = time.time() - start_time
-
-        if sensor.is_motion_detected():
+    while (elapsed := time.monotonic() - start_time) < duration:
+        if sensor.wait_for_edge(timeout=min(1.0, duration - elapsed)):
+            elapsed = time.monotonic() - start_time
             now = datetime.now()
 
             stats['total_events'] += 1
@@ -126,8 +127,6 @@ def test_continuous_monitoring(sensor, duration=30):
                 print(f"   [{int(elapsed)}s] Motion (Total: {stats['total_events']})")
                 last_detection = elapsed
 
-        time.sleep(0.1)
-
     # Print statistics
     print("\n   Statistics:")
     print(f"     Total detections: {stats['total_events']}")
@@ -136,11 +135,10 @@ def test_continuous_monitoring(sensor, duration=30):
         print(f"     First detection: {stats['first_detection'].strftime('%H:%M:%S')}")
         print(f"     Last detection: {stats['last_detection'].strftime('%H:%M:%S')}")
 
-        if len(stats['detection_times']) > 1:
-            avg_interval = sum([
-                stats['detection_times'][i] - stats['detection_times'][i-1]
-                for i in range(1, len(stats['detection_times']))
-            ]) / (len(stats['detection_times']) - 1)
+        times = stats['detection_times']
+        if len(times) > 1:
+            # Sum of consecutive intervals telescopes to last - first
+            avg_interval = (times[-1] - times[0]) / (len(times) - 1)
             print(f"     Average interval: {avg_interval:.1f}s")
 
     print("   ✓ Continuous monitoring test complete")
@@ -202,22 +200,27 @@ def test_sensitivity_calibration(sensor):
 def test_presence_detection_simulation(sensor, duration=20):
     """Simulate presence detection use case"""
     print("\n6. Presence detection simulation...")
-    print(f"   Simulating {duration}s of presence monitoring...")
+    print(f"   Simulating {duration:g}s of presence monitoring...")
 
     if not sensor.simulate:
         print("   Stay in view for first 10s, then leave for 10s")
 
     presence_log = []
-    last_motion = time.time()
+    last_motion = time.monotonic()
     inactivity_threshold = 5.0  # 5 seconds
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
-    while time.time() - start_time < duration:
-        elapsed = time.time() - start_time
+    while (elapsed := time.monotonic() - start_time) < duration:
+        # Wait on the edge instead of sleeping; also check the level, since
+        # a PIR held high by continued motion produces no new edge
+        motion = (sensor.wait_for_edge(timeout=min(0.5, duration - elapsed))
+                  or sensor.is_motion_detected())
+        now = time.monotonic()
+        elapsed = now - start_time
 
-        if sensor.is_motion_detected():
-            last_motion = time.time()
+        if motion:
+            last_motion = now
 
             if not presence_log or presence_log[-1] != 'present':
                 presence_log.append('present')
@@ -225,15 +228,13 @@ def test_presence_detection_simulation(sensor, duration=20):
 
         else:
             # Check if user has been away
-            time_since_motion = time.time() - last_motion
+            time_since_motion = now - last_motion
 
             if time_since_motion > inactivity_threshold:
                 if not presence_log or presence_log[-1] != 'away':
                     presence_log.append('away')
                     print(f"   [{int(elapsed)}s] User AWAY (no motion for {time_since_motion:.1f}s)")
 
-        time.sleep(0.5)
-
     print(f"\n   Presence log: {' → '.join(presence_log)}")
     print("   ✓ Presence detection test complete")
 
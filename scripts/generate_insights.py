@@ -54,8 +54,9 @@ def main():
 
         if save == 'y':
             report_file = Path(config.system.data_directory) / 'insights_report.txt'
+            # Stream straight to disk rather than writing the console copy
             with open(report_file, 'w') as f:
-                f.write(report)
+                learner.write_insights_report(f)
             print(f"\n✅ Report saved to: {report_file}")
 
         return 0
@@ -4,7 +4,10 @@ Tracks user activity, posture, and patterns
 """
 
 import time
+import queue
+import random
 import logging
+import threading
 from enum import Enum
 from typing import Optional, Dict
 from datetime import datetime, timedelta
@@ -23,12 +26,31 @@ class ActivityState(Enum):
     AWAY = "away"
 
 
+# States cycled through in simulation mode
+_SIM_STATES = (ActivityState.SITTING, ActivityState.STANDING, ActivityState.MOVING)
+
+# Activity implied by each detected posture (anything else is UNKNOWN)
+_POSTURE_MAP = {
+    PostureType.ABSENT: ActivityState.AWAY,
+    PostureType.SITTING: ActivityState.SITTING,
+    PostureType.STANDING: ActivityState.STANDING,
+    PostureType.LEANING_FORWARD: ActivityState.SITTING,  # Poor posture while sitting
+}
+
+
 class BehaviorMonitor:
     """Monitors user behavior and activity patterns"""
 
     def __init__(self, pose_detection_enabled: bool = True,
                  confidence_threshold: float = 0.7,
-                 simulate: bool = False):
+                 simulate: bool = False,
+                 target_hz: float = 4.0,
+                 batch_size: int = 1,
+                 batch_timeout: float = 0.1,
+                 static_image_mode: bool = False,
+                 pose_backend: str = 'mediapipe',
+                 model_path: Optional[str] = None,
+                 pause_event: Optional[threading.Event] = None):
         """
         Initialize behavior monitor
 
@@ -36,29 +58,58 @@ class BehaviorMonitor:
             pose_detection_enabled: Enable AI pose detection
             confidence_threshold: Minimum confidence for detections
             simulate: Use simulated data instead of camera
+            target_hz: Maximum pose detection rate; frames arriving faster
+                are dropped, since posture changes over seconds
+            batch_size: Most frames the pose worker hands to the detector in
+                one call. Larger batches suit backends with batched inference.
+            batch_timeout: Seconds the worker waits for a batch to fill
+                before running on the frames it has
+            static_image_mode: Passed to PoseDetector; leave False so pose
+                tracking carries over between the (in-order) frames
+            pose_backend: PoseDetector backend ('mediapipe', 'tflite',
+                'tflite_int8' or 'edgetpu')
+            model_path: TFLite pose model for the TFLite backends
+            pause_event: Passed to PoseDetector; while set, pose inference
+                is skipped and the last result reused
         """
         self.pose_detection_enabled = pose_detection_enabled
         self.confidence_threshold = confidence_threshold
         self.simulate = simulate
-
-        # State tracking
+        self.static_image_mode = static_image_mode
+        self.pose_backend = pose_backend
+        self.model_path = model_path
+        self.pause_event = pause_event
+
+        # State tracking (time.monotonic() timestamps; converted to
+        # datetime/timedelta only at the API boundary)
+        now = time.monotonic()
         self.current_state = ActivityState.UNKNOWN
-        self.last_state_change = datetime.now()
-        self.last_motion = datetime.now()
+        self.last_state_change = now
+        self.last_motion = now
+        self._tick_now = now  # Clock reading shared by one update tick
         self.sitting_start = None
         self.last_movement = None
 
-        # Statistics
-        self.total_sitting_time = timedelta()
-        self.total_standing_time = timedelta()
-        self.total_moving_time = timedelta()
+        # Statistics (seconds)
+        self.total_sitting_time = 0.0
+        self.total_standing_time = 0.0
+        self.total_moving_time = 0.0
 
         # Pose detection
         self.pose_detector = None
+        self._pose_interval = 1.0 / target_hz
+        self._last_pose_ts = 0.0
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._frame_q = None  # Newest frames awaiting the pose worker
+        self._pose_thread = None
+        self._results = []  # Finished (posture, confidence, landmarks) not yet applied
+        self._result_lock = threading.Lock()
         self.poor_posture_count = 0  # Track consecutive poor posture detections
 
         if not simulate and pose_detection_enabled:
-            self._init_pose_detection()
+            # Model load is slow; defer it until a real frame arrives
+            logger.info("Pose detection will initialize on the first frame")
         else:
             logger.info("Behavior monitor running in simulation mode")
 
@@ -67,53 +118,133 @@ class BehaviorMonitor:
         try:
             self.pose_detector = PoseDetector(
                 confidence_threshold=self.confidence_threshold,
-                simulate=self.simulate
+                simulate=self.simulate,
+                static_image_mode=self.static_image_mode,
+                backend=self.pose_backend,
+                model_path=self.model_path,
+                pause_event=self.pause_event
             )
             logger.info("Pose detection initialized successfully")
 
+            # Run inference off the caller's thread
+            self._frame_q = queue.Queue(maxsize=self._batch_size)
+            self._pose_thread = threading.Thread(target=self._pose_worker, daemon=True)
+            self._pose_thread.start()
+
         except Exception as e:
             logger.error(f"Failed to initialize pose detection: {e}")
             self.simulate = True
             self.pose_detector = None
 
-    def analyze_frame(self, frame) -> ActivityState:
+    def _pose_worker(self):
+        """Worker thread: run pose detection on batches of queued frames
+        until close() queues None"""
+        stopping = False
+        while not stopping:
+            frame = self._frame_q.get()
+            if frame is None:
+                break
+            frames = [frame]
+
+            # Gather more frames until the batch fills or the window closes
+            deadline = time.monotonic() + self._batch_timeout
+            while len(frames) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    frame = self._frame_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if frame is None:
+                    stopping = True
+                    break
+                frames.append(frame)
+
+            try:
+                results = self.pose_detector.detect_posture_batch(frames)
+            except Exception as e:
+                logger.error(f"Pose detection error: {e}")
+                continue
+
+            with self._result_lock:
+                self._results.extend(results)
+
+    def _submit_frame(self, frame):
+        """
+        Queue a copy of a frame for the pose worker, dropping the oldest
+        if full. Copied because callers may refill their frame buffer
+        while inference runs; frames are only submitted at target_hz.
+        """
+        self._enqueue(frame.copy())
+
+    def _enqueue(self, frame):
+        """Put an item on the worker queue, dropping the oldest if full"""
+        try:
+            self._frame_q.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put_nowait(frame)
+
+    def _tick(self, now: Optional[float] = None) -> float:
+        """Read the clock once for an update and everything it triggers"""
+        self._tick_now = time.monotonic() if now is None else now
+        return self._tick_now
+
+    def analyze_frame(self, frame, now: Optional[float] = None) -> ActivityState:
         """
         Analyze camera frame for user activity
 
+        Pose detection runs on a background thread, so this returns
+        immediately with the state from the newest finished detection.
+
         Args:
             frame: Camera frame (NumPy array)
+            now: Optional time.monotonic() reading to share with other
+                calls in the same loop iteration
 
         Returns:
             Detected activity state
         """
+        now = self._tick(now)
+
+        if (self.pose_detector is None and self.pose_detection_enabled
+                and not self.simulate and frame is not None):
+            self._init_pose_detection()
+
         if self.simulate or frame is None or self.pose_detector is None:
             # Simulate activity cycling
-            elapsed = (datetime.now() - self.last_state_change).total_seconds()
+            elapsed = now - self.last_state_change
 
             if elapsed > 30:  # Change state every 30s for testing
-                states = [ActivityState.SITTING, ActivityState.STANDING, ActivityState.MOVING]
-                import random
-                new_state = random.choice(states)
-                self._update_state(new_state)
+                self._update_state(_SIM_STATES[random.randrange(3)])
 
             return self.current_state
 
-        # Use pose detector
-        posture, confidence, landmarks = self.pose_detector.detect_posture(frame)
+        # Drop frames that arrive faster than the pose detection rate
+        if now - self._last_pose_ts >= self._pose_interval:
+            self._last_pose_ts = now
+            self._submit_frame(frame)
 
-        # Map posture to activity state
-        if posture == PostureType.ABSENT:
-            detected_state = ActivityState.AWAY
+        # Apply each finished detection once, in frame order
+        with self._result_lock:
+            results, self._results = self._results, []
 
-        elif posture == PostureType.SITTING:
-            detected_state = ActivityState.SITTING
+        for posture, confidence, landmarks in results:
+            self._apply_detection(posture, confidence)
 
-        elif posture == PostureType.STANDING:
-            detected_state = ActivityState.STANDING
+        return self.current_state
 
-        elif posture == PostureType.LEANING_FORWARD:
-            # Poor posture while sitting
-            detected_state = ActivityState.SITTING
+    def _apply_detection(self, posture: PostureType, confidence: float):
+        """Update activity state from one pose detection result"""
+        # Map posture to activity state
+        detected_state = _POSTURE_MAP.get(posture, ActivityState.UNKNOWN)
+        leaning = posture is PostureType.LEANING_FORWARD
+
+        if leaning:
             self.poor_posture_count += 1
 
             # Log warning after consecutive detections
@@ -121,28 +252,24 @@ class BehaviorMonitor:
                 logger.warning("Poor posture detected (leaning forward)")
                 self.poor_posture_count = 0
 
-        else:  # UNKNOWN
-            detected_state = ActivityState.UNKNOWN
-
         # Update state if confident
         if confidence >= self.confidence_threshold:
             self._update_state(detected_state)
 
             # Reset poor posture count if not leaning
-            if posture != PostureType.LEANING_FORWARD:
+            if not leaning:
                 self.poor_posture_count = 0
 
-        return self.current_state
-
-    def update_motion(self, motion_detected: bool):
+    def update_motion(self, motion_detected: bool, now: Optional[float] = None):
         """
         Update based on motion sensor
 
         Args:
             motion_detected: True if PIR detected motion
+            now: Optional time.monotonic() reading for this loop iteration
         """
         if motion_detected:
-            self.last_motion = datetime.now()
+            self.last_motion = self._tick(now)
 
             # If we thought user was away, update state
             if self.current_state == ActivityState.AWAY:
@@ -153,7 +280,7 @@ class BehaviorMonitor:
         if new_state == self.current_state:
             return
 
-        now = datetime.now()
+        now = self._tick_now
         elapsed = now - self.last_state_change
 
         # Update statistics for previous state
@@ -177,25 +304,52 @@ class BehaviorMonitor:
 
         logger.info(f"Activity state: {old_state.value} → {new_state.value}")
 
-    def get_sitting_duration(self) -> timedelta:
+    def get_sitting_duration(self, now: Optional[float] = None) -> float:
         """
         Get current sitting duration
 
+        Args:
+            now: Optional time.monotonic() reading for this loop iteration
+
         Returns:
-            Time sitting in current session
+            Seconds sitting in current session
         """
-        if self.current_state == ActivityState.SITTING and self.sitting_start:
-            return datetime.now() - self.sitting_start
-        return timedelta()
+        if self.current_state == ActivityState.SITTING and self.sitting_start is not None:
+            return (time.monotonic() if now is None else now) - self.sitting_start
+        return 0.0
 
-    def get_time_since_motion(self) -> timedelta:
+    def get_time_since_motion(self, now: Optional[float] = None) -> float:
         """
         Get time since last motion detected
 
+        Args:
+            now: Optional time.monotonic() reading for this loop iteration
+
         Returns:
-            Time since motion
+            Seconds since motion
+        """
+        return (time.monotonic() if now is None else now) - self.last_motion
+
+    def get_sitting_start(self) -> Optional[datetime]:
         """
-        return datetime.now() - self.last_motion
+        Get wall-clock start of the current sitting session (for persistence)
+
+        Returns:
+            Start time, or None if no session is being tracked
+        """
+        if self.sitting_start is None:
+            return None
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.sitting_start)
+
+    def restore_sitting_start(self, started_at: datetime):
+        """
+        Restore a sitting session start saved by get_sitting_start()
+
+        Args:
+            started_at: Wall-clock start time
+        """
+        elapsed = (datetime.now() - started_at).total_seconds()
+        self.sitting_start = time.monotonic() - elapsed
 
     def should_remind_to_move(self, threshold_minutes: int = 45) -> bool:
         """
@@ -207,8 +361,7 @@ class BehaviorMonitor:
         Returns:
             True if reminder needed
         """
-        sitting_duration = self.get_sitting_duration()
-        return sitting_duration >= timedelta(minutes=threshold_minutes)
+        return self.get_sitting_duration() >= threshold_minutes * 60
 
     def should_remind_hydration(self, interval_minutes: int = 60) -> bool:
         """
@@ -222,13 +375,12 @@ class BehaviorMonitor:
         """
         # TODO: Track last hydration reminder time
         # For now, use simple time-based logic
+        now = time.monotonic()
         if not hasattr(self, '_last_hydration_reminder'):
-            self._last_hydration_reminder = datetime.now()
-
-        elapsed = datetime.now() - self._last_hydration_reminder
+            self._last_hydration_reminder = now
 
-        if elapsed >= timedelta(minutes=interval_minutes):
-            self._last_hydration_reminder = datetime.now()
+        if now - self._last_hydration_reminder >= interval_minutes * 60:
+            self._last_hydration_reminder = now
             return True
 
         return False
@@ -243,8 +395,7 @@ class BehaviorMonitor:
         Returns:
             True if user is likely away
         """
-        time_since_motion = self.get_time_since_motion()
-        return time_since_motion >= timedelta(minutes=inactivity_minutes)
+        return self.get_time_since_motion() >= inactivity_minutes * 60
 
     def get_statistics(self) -> Dict:
         """
@@ -255,18 +406,18 @@ class BehaviorMonitor:
         """
         return {
             'current_state': self.current_state.value,
-            'sitting_duration': str(self.get_sitting_duration()),
-            'total_sitting': str(self.total_sitting_time),
-            'total_standing': str(self.total_standing_time),
-            'total_moving': str(self.total_moving_time),
-            'time_since_motion': str(self.get_time_since_motion()),
+            'sitting_duration': str(timedelta(seconds=self.get_sitting_duration())),
+            'total_sitting': str(timedelta(seconds=self.total_sitting_time)),
+            'total_standing': str(timedelta(seconds=self.total_standing_time)),
+            'total_moving': str(timedelta(seconds=self.total_moving_time)),
+            'time_since_motion': str(timedelta(seconds=self.get_time_since_motion())),
         }
 
     def reset_statistics(self):
         """Reset all statistics"""
-        self.total_sitting_time = timedelta()
-        self.total_standing_time = timedelta()
-        self.total_moving_time = timedelta()
+        self.total_sitting_time = 0.0
+        self.total_standing_time = 0.0
+        self.total_moving_time = 0.0
 
     def check_user_responded_to_movement_reminder(self, timeout_seconds: int = 300) -> bool:
         """
@@ -281,7 +432,7 @@ class BehaviorMonitor:
         if not hasattr(self, '_movement_reminder_time'):
             return False
 
-        time_since_reminder = (datetime.now() - self._movement_reminder_time).total_seconds()
+        time_since_reminder = time.monotonic() - self._movement_reminder_time
 
         if time_since_reminder > timeout_seconds:
             # Timeout - consider no response
@@ -297,7 +448,7 @@ class BehaviorMonitor:
 
     def mark_movement_reminder_sent(self):
         """Mark that a movement reminder was just sent"""
-        self._movement_reminder_time = datetime.now()
+        self._movement_reminder_time = time.monotonic()
 
     def has_poor_posture(self) -> bool:
         """Check if user currently has poor posture"""
@@ -319,6 +470,23 @@ class BehaviorMonitor:
         else:
             return 0.0
 
+    def close(self):
+        """Stop the pose worker and release the pose detector"""
+        self.pose_detection_enabled = False  # Don't reinitialize on later frames
+
+        if self._pose_thread is not None:
+            self._enqueue(None)
+            self._pose_thread.join(timeout=5.0)
+            if self._pose_thread.is_alive():
+                # Still inside inference; leave the detector to it
+                logger.warning("Pose worker did not stop in time")
+                return
+            self._pose_thread = None
+
+        if self.pose_detector is not None:
+            self.pose_detector.close()
+            self.pose_detector = None
+
 
 if __name__ == '__main__':
     """Test behavior monitor"""
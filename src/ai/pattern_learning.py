@@ -3,15 +3,250 @@ Pattern Learning System
 Learns user habits and optimal reminder timing
 """
 
+import io
+import copy
 import json
+import time
+import functools
 import logging
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, TextIO
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
+# orjson is several times faster than the stdlib encoder; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Activity records kept in memory on load and on disk after compaction
+MAX_ACTIVITY_RECORDS = 1000
+
+# Fixed insights report text, built once
+_SEP = "=" * 60
+_DASH = "-" * 60
+_REPORT_HEADER = f"{_SEP}\nPIXEL PLANT - LEARNING INSIGHTS REPORT\n{_SEP}\n\n"
+_REMINDER_HEADING = f"REMINDER EFFECTIVENESS:\n{_DASH}\n"
+_ACTIVITY_HEADING = f"\nACTIVITY PATTERNS:\n{_DASH}\n"
+_SITTING_HEADING = f"\nSITTING PATTERNS:\n{_DASH}\n"
+_RECOMMENDATIONS_HEADING = f"\nRECOMMENDATIONS:\n{_DASH}\n"
+
+
+def _memoize_analysis(state_key):
+    """
+    Cache an analysis method's result until the data it reads changes
+
+    Callers get a deep copy, so editing a returned dict or list can't
+    change what later calls return.
+
+    Args:
+        state_key: Function (self, *args) -> hashable snapshot of the data
+            the method depends on; logs only grow, so their lengths suffice
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = (method.__name__, args)
+            state = state_key(self, *args)
+
+            cached = self._analysis_cache.get(key)
+            if cached is not None and cached[0] == state:
+                return copy.deepcopy(cached[1])
+
+            result = method(self, *args)
+            self._analysis_cache[key] = (state, result)
+            return copy.deepcopy(result)
+        return wrapper
+    return decorator
+
+
+def _activity_log_size(learner, *args):
+    return learner.activities_logged
+
+
+def _reminder_log_size(learner, reminder_type):
+    return len(learner.reminder_effectiveness.get(reminder_type, ()))
+
+
+def _all_log_sizes(learner):
+    return (learner.activities_logged,
+            tuple((t, len(s)) for t, s in learner.reminder_effectiveness.items()))
+
+
+class ActivityType(IntEnum):
+    """Integer codes for the activity types the app logs"""
+    OTHER = 0
+    SITTING = 1
+    BREAK = 2
+    STATE_UPDATE = 3
+    REMINDER_SENT = 4
+
+
+class ActivityEventState(IntEnum):
+    """Integer codes for activity states that analysis filters on"""
+    OTHER = 0
+    STARTED = 1
+
+
+_ACTIVITY_TYPE_CODES = {t.name.lower(): t for t in ActivityType}
+_EVENT_STATE_CODES = {s.name.lower(): s for s in ActivityEventState}
+
+
+class ActivityColumns:
+    """
+    Per-record analysis columns for the bounded activity log
+
+    A ring buffer the same size as the log, so the oldest entry is
+    overwritten when the log drops its oldest record. Row order is not
+    kept; the analyses only count.
+    """
+
+    def __init__(self, capacity: int = MAX_ACTIVITY_RECORDS):
+        """
+        Initialize empty columns
+
+        Args:
+            capacity: Number of records held before overwriting
+        """
+        self._capacity = capacity
+        self._next = 0
+        self._size = 0
+        self._hour = np.empty(capacity, dtype=np.int8)
+        self._weekday = np.empty(capacity, dtype=np.int8)
+        self._type = np.empty(capacity, dtype=np.uint8)
+        self._state = np.empty(capacity, dtype=np.uint8)
+
+    @property
+    def hour(self) -> np.ndarray:
+        """Local hour of each record (-1 if unknown)"""
+        return self._hour[:self._size]
+
+    @property
+    def weekday(self) -> np.ndarray:
+        """Weekday of each record, 0=Monday (-1 if unknown)"""
+        return self._weekday[:self._size]
+
+    @property
+    def activity_type(self) -> np.ndarray:
+        """ActivityType code of each record"""
+        return self._type[:self._size]
+
+    @property
+    def state(self) -> np.ndarray:
+        """ActivityEventState code of each record"""
+        return self._state[:self._size]
+
+    def append(self, record: Dict):
+        """
+        Add one activity record's codes
+
+        Args:
+            record: Activity record with 'hour' and 'weekday' set
+        """
+        i = self._next
+        self._hour[i] = record['hour']
+        self._weekday[i] = record['weekday']
+        self._type[i] = _ACTIVITY_TYPE_CODES.get(record.get('activity_type'), ActivityType.OTHER)
+        self._state[i] = _EVENT_STATE_CODES.get(record.get('state'), ActivityEventState.OTHER)
+
+        self._next = (i + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+
+class ReminderSeries:
+    """Columnar log of user responses to one reminder type"""
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty series
+
+        Args:
+            capacity: Initial number of responses before the arrays grow
+        """
+        self._size = 0
+        self._ts = np.empty(capacity, dtype=np.float64)
+        self._resp = np.empty(capacity, dtype=np.uint8)
+        self._rt = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def ts(self) -> np.ndarray:
+        """Response timestamps (epoch seconds)"""
+        return self._ts[:self._size]
+
+    @property
+    def resp(self) -> np.ndarray:
+        """1 where the user responded, 0 where the reminder was ignored"""
+        return self._resp[:self._size]
+
+    @property
+    def rt(self) -> np.ndarray:
+        """Response times in seconds, NaN where unknown"""
+        return self._rt[:self._size]
+
+    def append(self, ts: float, responded: bool, response_time: Optional[float]):
+        """
+        Add one response
+
+        Args:
+            ts: Epoch seconds when the response was logged
+            responded: True if user took action
+            response_time: Time taken to respond (seconds), or None
+        """
+        if self._size == self._ts.size:
+            # Double capacity so appends stay amortized O(1)
+            capacity = 2 * self._ts.size
+            self._ts = np.resize(self._ts, capacity)
+            self._resp = np.resize(self._resp, capacity)
+            self._rt = np.resize(self._rt, capacity)
+
+        i = self._size
+        self._ts[i] = ts
+        self._resp[i] = 1 if responded else 0
+        self._rt[i] = np.nan if response_time is None else response_time
+        self._size += 1
+
+    def to_dict(self) -> Dict:
+        """Serialize as JSON-friendly columns"""
+        return {
+            'ts': self.ts.tolist(),
+            'responded': self.resp.astype(bool).tolist(),
+            'response_time': [None if t != t else t for t in self.rt.tolist()],
+        }
+
+    @classmethod
+    def from_saved(cls, saved) -> 'ReminderSeries':
+        """
+        Rebuild a series from to_dict() output, or from the older list of
+        {'timestamp', 'responded', 'response_time'} records
+
+        Args:
+            saved: Dict of columns or list of record dicts
+
+        Returns:
+            ReminderSeries
+        """
+        if isinstance(saved, dict):
+            rows = zip(saved['ts'], saved['responded'], saved['response_time'])
+        else:
+            rows = (
+                (datetime.fromisoformat(r['timestamp']).timestamp(),
+                 r.get('responded', False), r.get('response_time'))
+                for r in saved
+            )
+
+        series = cls()
+        for ts, responded, response_time in rows:
+            series.append(ts, responded, response_time)
+        return series
+
 
 class PatternLearner:
     """Learns and adapts to user behavior patterns"""
@@ -34,13 +269,23 @@ class PatternLearner:
         self.data_directory.mkdir(parents=True, exist_ok=True)
 
         self.patterns_file = self.data_directory / 'behavior_patterns.json'
+        self.activity_log_file = self.data_directory / 'activity_log.jsonl'
 
         # Pattern data
-        self.activity_log = []
-        self.reminder_effectiveness = defaultdict(list)
+        # Bounded: the oldest records drop off as new ones arrive
+        self.activity_log = deque(maxlen=MAX_ACTIVITY_RECORDS)
+        self.activities_logged = 0  # Appends since load; len() stops at the bound
+        self._activity_columns = ActivityColumns()
+        self.reminder_effectiveness = defaultdict(ReminderSeries)
         self.typical_break_times = []
         self.hydration_patterns = []
 
+        # Append-only activity log, opened on first write
+        self._log_fp = None
+
+        # Memoized analysis results: (method, args) -> (log sizes, result)
+        self._analysis_cache = {}
+
         # Load existing patterns
         self._load_patterns()
 
@@ -48,19 +293,27 @@ class PatternLearner:
 
     def _load_patterns(self):
         """Load previously learned patterns"""
-        if not self.patterns_file.exists():
+        if not self.patterns_file.exists() and not self.activity_log_file.exists():
             logger.info("No existing patterns found")
             return
 
         try:
-            with open(self.patterns_file, 'r') as f:
-                data = json.load(f)
+            data = {}
+            if self.patterns_file.exists():
+                with open(self.patterns_file, 'r') as f:
+                    data = _loads(f.read())
+
+            if self.activity_log_file.exists():
+                self._load_activity_log()
+            elif data.get('activity_log'):
+                # Older files kept the activity log inline; move it out
+                self.activity_log = deque(data['activity_log'], maxlen=MAX_ACTIVITY_RECORDS)
+                self._index_activity_log()
+                self._rewrite_activity_log()
+
+            for reminder_type, saved in data.get('reminder_effectiveness', {}).items():
+                self.reminder_effectiveness[reminder_type] = ReminderSeries.from_saved(saved)
 
-            self.activity_log = data.get('activity_log', [])
-            self.reminder_effectiveness = defaultdict(
-                list,
-                data.get('reminder_effectiveness', {})
-            )
             self.typical_break_times = data.get('typical_break_times', [])
             self.hydration_patterns = data.get('hydration_patterns', [])
 
@@ -69,22 +322,72 @@ class PatternLearner:
         except Exception as e:
             logger.error(f"Failed to load patterns: {e}")
 
+    def _load_activity_log(self):
+        """Read the last MAX_ACTIVITY_RECORDS records from the JSONL log"""
+        line_count = 0
+        recent = deque(maxlen=MAX_ACTIVITY_RECORDS)
+
+        with open(self.activity_log_file, 'r') as f:
+            for line in f:
+                line_count += 1
+                recent.append(line)
+
+        records = deque(maxlen=MAX_ACTIVITY_RECORDS)
+        for line in recent:
+            try:
+                records.append(_loads(line))
+            except ValueError:
+                continue  # Torn final line from an unclean shutdown
+        self.activity_log = records
+        self._index_activity_log()
+
+        # Compact once the file holds well over what we keep, or to drop
+        # a torn line that the next append would run into
+        torn = bool(recent) and not recent[-1].endswith('\n')
+        if torn or line_count > 2 * MAX_ACTIVITY_RECORDS:
+            self._rewrite_activity_log()
+
+    def _index_activity_log(self):
+        """Rebuild the analysis columns from freshly loaded records"""
+        _add_time_fields(self.activity_log)
+
+        self._activity_columns = ActivityColumns()
+        for record in self.activity_log:
+            self._activity_columns.append(record)
+
+    def _rewrite_activity_log(self):
+        """Replace the JSONL log with the in-memory records"""
+        tmp_file = self.activity_log_file.with_suffix('.tmp')
+
+        with open(tmp_file, 'w') as f:
+            for record in self.activity_log:
+                f.write(_dumps(record))
+                f.write('\n')
+
+        tmp_file.replace(self.activity_log_file)
+
     def save_patterns(self):
         """Save learned patterns to disk"""
         if not self.learning_enabled:
             return
 
+        # Activity records are already on disk; just push out the buffer
+        if self._log_fp:
+            self._log_fp.flush()
+
         try:
             data = {
-                'activity_log': self.activity_log[-1000:],  # Keep last 1000 records
-                'reminder_effectiveness': dict(self.reminder_effectiveness),
+                'reminder_effectiveness': {
+                    reminder_type: series.to_dict()
+                    for reminder_type, series in self.reminder_effectiveness.items()
+                },
                 'typical_break_times': self.typical_break_times,
                 'hydration_patterns': self.hydration_patterns,
                 'last_updated': datetime.now().isoformat(),
             }
 
             with open(self.patterns_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(_dumps(data))
 
             logger.debug("Patterns saved")
 
@@ -103,18 +406,36 @@ class PatternLearner:
         if not self.learning_enabled:
             return
 
+        # Epoch seconds, plus local hour and weekday so analysis never
+        # converts timestamps
+        now = time.time()
+        local = time.localtime(now)
         record = {
-            'timestamp': datetime.now().isoformat(),
+            'ts': now,
+            'hour': local.tm_hour,
+            'weekday': local.tm_wday,
             'activity_type': activity_type,
             'state': state,
             'metadata': metadata or {}
         }
 
         self.activity_log.append(record)
+        self._activity_columns.append(record)
+        self.activities_logged += 1
+
+        try:
+            if self._log_fp is None:
+                self._log_fp = open(self.activity_log_file, 'a', buffering=8192)
+
+            self._log_fp.write(_dumps(record))
+            self._log_fp.write('\n')
 
-        # Auto-save periodically
-        if len(self.activity_log) % 50 == 0:
-            self.save_patterns()
+            # Flush periodically so a crash loses at most a few records
+            if self.activities_logged % 50 == 0:
+                self._log_fp.flush()
+
+        except Exception as e:
+            logger.error(f"Failed to append activity record: {e}")
 
     def log_reminder_response(self, reminder_type: str, user_responded: bool,
                               response_time: Optional[float] = None):
@@ -129,17 +450,22 @@ class PatternLearner:
         if not self.learning_enabled:
             return
 
-        effectiveness = {
-            'timestamp': datetime.now().isoformat(),
-            'responded': user_responded,
-            'response_time': response_time,
-        }
-
-        self.reminder_effectiveness[reminder_type].append(effectiveness)
+        self.reminder_effectiveness[reminder_type].append(
+            time.time(), user_responded, response_time
+        )
 
         logger.debug(f"Logged reminder response: {reminder_type} "
                     f"({'responded' if user_responded else 'ignored'})")
 
+    def close(self):
+        """Flush and close the activity log"""
+        if self._log_fp:
+            try:
+                self._log_fp.close()
+            except Exception as e:
+                logger.error(f"Failed to close activity log: {e}")
+            self._log_fp = None
+
     def get_optimal_reminder_time(self, reminder_type: str) -> Optional[int]:
         """
         Get optimal time for a reminder based on learned patterns
@@ -154,7 +480,7 @@ class PatternLearner:
             return None
 
         # Analyze when user typically responds positively
-        responses = self.reminder_effectiveness.get(reminder_type, [])
+        responses = self.reminder_effectiveness.get(reminder_type, ())
 
         if len(responses) < 5:  # Not enough data
             return None
@@ -192,6 +518,7 @@ class PatternLearner:
             'data_window_days': self.pattern_window_days,
         }
 
+    @_memoize_analysis(_reminder_log_size)
     def analyze_reminder_effectiveness(self, reminder_type: str) -> Dict:
         """
         Analyze how effective a reminder type has been
@@ -202,26 +529,23 @@ class PatternLearner:
         Returns:
             Dictionary with effectiveness metrics
         """
-        responses = self.reminder_effectiveness.get(reminder_type, [])
+        series = self.reminder_effectiveness.get(reminder_type)
+        total = len(series) if series is not None else 0
 
-        if len(responses) < 3:
+        if total < 3:
             return {
-                'sample_size': len(responses),
+                'sample_size': total,
                 'sufficient_data': False,
             }
 
         # Calculate metrics
-        total = len(responses)
-        responded = sum(1 for r in responses if r.get('responded', False))
-        response_rate = responded / total if total > 0 else 0
+        responded = int(np.count_nonzero(series.resp))
+        response_rate = responded / total
 
         # Calculate average response time for those who responded
-        response_times = [
-            r.get('response_time', 0) for r in responses
-            if r.get('responded', False) and r.get('response_time') is not None
-        ]
+        response_times = series.rt[(series.resp != 0) & ~np.isnan(series.rt)]
 
-        avg_response_time = sum(response_times) / len(response_times) if response_times else None
+        avg_response_time = float(response_times.mean(dtype=np.float64)) if response_times.size else None
 
         return {
             'sample_size': total,
@@ -244,6 +568,7 @@ class PatternLearner:
         else:
             return "ineffective"
 
+    @_memoize_analysis(_activity_log_size)
     def analyze_activity_patterns(self) -> Dict:
         """
         Analyze activity log for patterns
@@ -254,27 +579,24 @@ class PatternLearner:
         if len(self.activity_log) < 10:
             return {'sufficient_data': False}
 
-        # Group by hour of day
-        hourly_activity = defaultdict(list)
+        # Count records per hour of day (-1 marks an unreadable timestamp)
+        hours = self._activity_columns.hour
+        counts = np.bincount(hours[hours >= 0], minlength=24)
 
-        for record in self.activity_log:
-            try:
-                timestamp = datetime.fromisoformat(record['timestamp'])
-                hour = timestamp.hour
-                hourly_activity[hour].append(record)
-            except:
-                continue
-
-        # Find most active hours
-        activity_counts = {
-            hour: len(activities)
-            for hour, activities in hourly_activity.items()
-        }
+        # Pick the three busiest and quietest hours that saw any activity,
+        # each listed busiest first
+        active = np.flatnonzero(counts)
+        k = min(3, active.size)
+        most_active_hours = []
+        least_active_hours = []
 
-        sorted_hours = sorted(activity_counts.items(), key=lambda x: x[1], reverse=True)
+        if k:
+            top = active[np.argpartition(-counts[active], k - 1)[:k]]
+            bottom = active[np.argpartition(counts[active], k - 1)[:k]]
+            most_active_hours = top[np.argsort(-counts[top], kind='stable')].tolist()
+            least_active_hours = bottom[np.argsort(-counts[bottom], kind='stable')].tolist()
 
-        most_active_hours = [hour for hour, count in sorted_hours[:3]]
-        least_active_hours = [hour for hour, count in sorted_hours[-3:]]
+        activity_counts = {int(hour): int(counts[hour]) for hour in active}
 
         return {
             'sufficient_data': True,
@@ -284,14 +606,19 @@ class PatternLearner:
             'hourly_distribution': activity_counts,
         }
 
-    def suggest_optimal_reminder_times(self) -> List[int]:
+    def suggest_optimal_reminder_times(self, patterns: Optional[Dict] = None) -> List[int]:
         """
         Suggest optimal hours for reminders based on activity
 
+        Args:
+            patterns: Result of analyze_activity_patterns(), if the caller
+                already has it (avoids re-scanning the activity log)
+
         Returns:
             List of hours (0-23) when user is most receptive
         """
-        patterns = self.analyze_activity_patterns()
+        if patterns is None:
+            patterns = self.analyze_activity_patterns()
 
         if not patterns.get('sufficient_data', False):
             # Default suggestions
@@ -300,6 +627,7 @@ class PatternLearner:
         # Suggest reminders during most active hours
         return patterns.get('most_active_hours', [10, 14, 16])
 
+    @_memoize_analysis(_activity_log_size)
     def get_sitting_statistics(self) -> Dict:
         """
         Analyze sitting patterns
@@ -307,41 +635,34 @@ class PatternLearner:
         Returns:
             Dictionary with sitting statistics
         """
-        sitting_sessions = [
-            record for record in self.activity_log
-            if record.get('activity_type') == 'sitting' and
-               record.get('state') == 'started'
-        ]
+        columns = self._activity_columns
+        sitting_started = ((columns.activity_type == ActivityType.SITTING) &
+                           (columns.state == ActivityEventState.STARTED))
+        total_sessions = int(np.count_nonzero(sitting_started))
 
-        if len(sitting_sessions) < 5:
+        if total_sessions < 5:
             return {'sufficient_data': False}
 
-        # Group by day of week
-        weekday_sessions = defaultdict(list)
-
-        for session in sitting_sessions:
-            try:
-                timestamp = datetime.fromisoformat(session['timestamp'])
-                weekday = timestamp.weekday()  # 0=Monday, 6=Sunday
-                weekday_sessions[weekday].append(session)
-            except:
-                continue
+        # Count sessions per day of week (0=Monday)
+        weekdays = columns.weekday[sitting_started]
+        counts = np.bincount(weekdays[weekdays >= 0], minlength=7)
 
         weekday_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday',
                         'Friday', 'Saturday', 'Sunday']
 
         sessions_by_day = {
-            weekday_names[day]: len(sessions)
-            for day, sessions in weekday_sessions.items()
+            weekday_names[day]: int(counts[day])
+            for day in np.flatnonzero(counts)
         }
 
         return {
             'sufficient_data': True,
-            'total_sessions': len(sitting_sessions),
+            'total_sessions': total_sessions,
             'sessions_by_weekday': sessions_by_day,
             'most_sitting_day': max(sessions_by_day, key=sessions_by_day.get) if sessions_by_day else None,
         }
 
+    @_memoize_analysis(_all_log_sizes)
     def export_insights_report(self) -> str:
         """
         Generate human-readable insights report
@@ -349,85 +670,118 @@ class PatternLearner:
         Returns:
             Multi-line string with insights
         """
-        report = ["=" * 60]
-        report.append("PIXEL PLANT - LEARNING INSIGHTS REPORT")
-        report.append("=" * 60)
-        report.append("")
+        buf = io.StringIO()
+        self.write_insights_report(buf)
+        return buf.getvalue().rstrip("\n")
+
+    def write_insights_report(self, fp: TextIO):
+        """
+        Write the human-readable insights report to an open text file
+
+        Lines are written as they are produced, so saving a long history
+        never holds the whole report in memory.
+
+        Args:
+            fp: Writable text file object
+        """
+        write = fp.write
 
         # Overall statistics
         summary = self.get_learning_summary()
-        report.append(f"Total Activities Logged: {summary['total_activities_logged']}")
-        report.append(f"Learning Enabled: {summary['learning_enabled']}")
-        report.append("")
+        write(_REPORT_HEADER)
+        write(f"Total Activities Logged: {summary['total_activities_logged']}\n"
+              f"Learning Enabled: {summary['learning_enabled']}\n\n")
 
         # Reminder effectiveness
-        report.append("REMINDER EFFECTIVENESS:")
-        report.append("-" * 60)
+        write(_REMINDER_HEADING)
 
         for reminder_type in summary['reminder_types_tracked']:
             analysis = self.analyze_reminder_effectiveness(reminder_type)
+            name = reminder_type.capitalize()
 
             if analysis['sufficient_data']:
-                report.append(f"\n{reminder_type.capitalize()}:")
-                report.append(f"  Response Rate: {analysis['response_rate']:.1%}")
-                report.append(f"  Responded: {analysis['responded_count']}")
-                report.append(f"  Ignored: {analysis['ignored_count']}")
+                write(f"\n{name}:\n"
+                      f"  Response Rate: {analysis['response_rate']:.1%}\n"
+                      f"  Responded: {analysis['responded_count']}\n"
+                      f"  Ignored: {analysis['ignored_count']}\n")
 
                 if analysis['avg_response_time_seconds']:
-                    report.append(f"  Avg Response Time: {analysis['avg_response_time_seconds']:.1f}s")
+                    write(f"  Avg Response Time: {analysis['avg_response_time_seconds']:.1f}s\n")
 
-                report.append(f"  Recommendation: {analysis['recommendation']}")
+                write(f"  Recommendation: {analysis['recommendation']}\n")
             else:
-                report.append(f"\n{reminder_type.capitalize()}: Insufficient data ({analysis['sample_size']} samples)")
-
-        report.append("")
+                write(f"\n{name}: Insufficient data ({analysis['sample_size']} samples)\n")
 
         # Activity patterns
-        report.append("ACTIVITY PATTERNS:")
-        report.append("-" * 60)
+        write(_ACTIVITY_HEADING)
 
         patterns = self.analyze_activity_patterns()
 
         if patterns.get('sufficient_data', False):
-            report.append(f"\nTotal Records: {patterns['total_records']}")
-            report.append(f"Most Active Hours: {', '.join(map(str, patterns['most_active_hours']))}")
-            report.append(f"Least Active Hours: {', '.join(map(str, patterns['least_active_hours']))}")
+            write(f"\nTotal Records: {patterns['total_records']}\n"
+                  f"Most Active Hours: {', '.join(map(str, patterns['most_active_hours']))}\n"
+                  f"Least Active Hours: {', '.join(map(str, patterns['least_active_hours']))}\n")
         else:
-            report.append("\nInsufficient data for pattern analysis")
-
-        report.append("")
+            write("\nInsufficient data for pattern analysis\n")
 
         # Sitting statistics
-        report.append("SITTING PATTERNS:")
-        report.append("-" * 60)
+        write(_SITTING_HEADING)
 
         sitting_stats = self.get_sitting_statistics()
 
         if sitting_stats.get('sufficient_data', False):
-            report.append(f"\nTotal Sitting Sessions: {sitting_stats['total_sessions']}")
+            write(f"\nTotal Sitting Sessions: {sitting_stats['total_sessions']}\n")
 
             if sitting_stats['sessions_by_weekday']:
-                report.append("\nSessions by Weekday:")
+                write("\nSessions by Weekday:\n")
                 for day, count in sitting_stats['sessions_by_weekday'].items():
-                    report.append(f"  {day}: {count}")
+                    write(f"  {day}: {count}\n")
 
-                report.append(f"\nMost Sitting: {sitting_stats['most_sitting_day']}")
+                write(f"\nMost Sitting: {sitting_stats['most_sitting_day']}\n")
         else:
-            report.append("\nInsufficient data for sitting analysis")
-
-        report.append("")
+            write("\nInsufficient data for sitting analysis\n")
 
         # Recommendations
-        report.append("RECOMMENDATIONS:")
-        report.append("-" * 60)
+        write(_RECOMMENDATIONS_HEADING)
+
+        optimal_times = self.suggest_optimal_reminder_times(patterns)
+        write(f"\nOptimal Reminder Times: {', '.join([f'{h}:00' for h in optimal_times])}\n"
+              f"\n{_SEP}\n")
+
 
-        optimal_times = self.suggest_optimal_reminder_times()
-        report.append(f"\nOptimal Reminder Times: {', '.join([f'{h}:00' for h in optimal_times])}")
+def _dumps(obj) -> str:
+    """Encode to compact JSON (no indentation)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(',', ':'))
 
-        report.append("")
-        report.append("=" * 60)
 
-        return "\n".join(report)
+def _loads(text: str):
+    """Decode JSON text"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _add_time_fields(records: Iterable[Dict]):
+    """
+    Fill in 'hour' and 'weekday' on records logged before they were stored
+    (those records carry an ISO 'timestamp' instead of epoch 'ts')
+
+    Args:
+        records: Activity records, updated in place; an unreadable
+            timestamp gets -1 for both fields
+    """
+    for record in records:
+        if 'hour' in record:
+            continue
+
+        try:
+            timestamp = datetime.fromisoformat(record['timestamp'])
+            record['hour'] = timestamp.hour
+            record['weekday'] = timestamp.weekday()
+        except (KeyError, ValueError, TypeError):
+            record['hour'] = record['weekday'] = -1
 
 
 if __name__ == '__main__':
@@ -461,3 +815,5 @@ if __name__ == '__main__':
         print(f"  {key}: {value}")
 
     print(f"\nPatterns saved to: {learner.patterns_file}")
+
+    learner.close()
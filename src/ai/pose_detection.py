@@ -1,59 +1,248 @@
 """
 Pose Detection Module
-Uses MediaPipe for real-time pose estimation
+Uses MediaPipe (or a TFLite landmark model) for real-time pose estimation
 Detects sitting, standing, and movement patterns
 """
 
 import logging
+import importlib
+import threading
+import importlib.util
 import numpy as np
-from typing import Optional, Tuple, Dict
-from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Dict, List
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
+POSE_BACKENDS = ('mediapipe', 'tflite', 'tflite_int8', 'edgetpu')
 
-class PostureType(Enum):
-    """Detected posture types"""
-    UNKNOWN = "unknown"
-    SITTING = "sitting"
-    STANDING = "standing"
-    LEANING_FORWARD = "leaning_forward"  # Poor posture
-    ABSENT = "absent"  # No person detected
+# Landmark indices (MediaPipe standard): nose, shoulders (L, R), hips (L, R)
+_KEY_POINTS = np.array([0, 11, 12, 23, 24])
+NUM_LANDMARKS = 33
+
+# Posture thresholds (tunable based on camera setup)
+SITTING_THRESHOLD = 0.5  # Hip should be in lower half of frame
+FORWARD_LEAN_THRESHOLD = 20.0  # degrees from vertical
+
+# MediaPipe Pose Lite's input size; larger frames are shrunk to this first
+_MEDIAPIPE_INPUT_SIZE = 256
+
+# Simulated detections draw from random buffers of this length
+_SIM_BUFFER_SIZE = 4096
+
+# Side of the grayscale thumbnail compared between frames
+_THUMB_SIZE = 64
+
+
+class PostureType(IntEnum):
+    """Detected posture types (integer codes; name.lower() for display)"""
+    UNKNOWN = 0
+    SITTING = 1
+    STANDING = 2
+    LEANING_FORWARD = 3  # Poor posture
+    ABSENT = 4  # No person detected
 
 
 class PoseDetector:
-    """MediaPipe-based pose detection"""
+    """MediaPipe or TFLite based pose detection"""
 
     def __init__(self, confidence_threshold: float = 0.7,
-                 simulate: bool = False):
+                 simulate: bool = False,
+                 static_image_mode: bool = False,
+                 backend: str = 'mediapipe',
+                 model_path: Optional[str] = None,
+                 motion_threshold: float = 3.0,
+                 max_cache_frames: int = 15,
+                 pause_event: Optional[threading.Event] = None):
         """
         Initialize pose detector
 
         Args:
             confidence_threshold: Minimum confidence for detections
             simulate: Use simulated detections for testing
+            static_image_mode: Run full detection on every frame. When False,
+                the previous frame's pose seeds tracking in the next, so
+                frames must be passed in temporal order.
+            backend: 'mediapipe', 'tflite' (float landmark model on all
+                CPU cores through XNNPACK), 'tflite_int8' (quantized model
+                on the CPU) or 'edgetpu' (quantized model on a Coral USB
+                accelerator)
+            model_path: TFLite pose landmark model, for the TFLite backends.
+                If missing, 'tflite' uses the lite model bundled with the
+                mediapipe package.
+            motion_threshold: Mean absolute grayscale difference (0-255)
+                below which a frame counts as unchanged and reuses the last
+                detection
+            max_cache_frames: Most consecutive frames served from the last
+                detection before running the model again
+            pause_event: While set (e.g. AudioSystem.speaking), frames get
+                the last result instead of running inference
         """
+        if backend not in POSE_BACKENDS:
+            raise ValueError(f"Unknown pose backend {backend!r}, expected one of {POSE_BACKENDS}")
+
         self.confidence_threshold = confidence_threshold
         self.simulate = simulate
+        self.static_image_mode = static_image_mode
+        self.backend = backend
+        self.model_path = model_path
         self.mp_pose = None
         self.pose = None
+        self.interpreter = None
+
+        # Last confident detection, reused while the scene is still
+        self.motion_threshold = motion_threshold
+        self.max_cache_frames = max_cache_frames
+        self._cache_thumb = None
+        self._cache_result = None
+        self._cache_hits = 0
+        self.pause_event = pause_event
+        self._last_result = (PostureType.UNKNOWN, 0.0, None)
 
         # Simulation state
         self._sim_frame_count = 0
         self._sim_posture = PostureType.SITTING
+        self._sim_postures = (PostureType.SITTING, PostureType.STANDING, PostureType.LEANING_FORWARD)
+        self._rng = np.random.default_rng()
+        self._refill_sim_buffers()
 
-        if not simulate:
+        if simulate:
+            logger.info("Pose detector running in simulation mode")
+        elif backend == 'mediapipe':
             self._init_mediapipe()
         else:
-            logger.info("Pose detector running in simulation mode")
+            self._init_tflite()
+
+    def _init_tflite(self):
+        """Initialize the TFLite landmark model, on the Edge TPU if selected"""
+        try:
+            try:
+                from tflite_runtime.interpreter import Interpreter, load_delegate
+            except ImportError:
+                import tensorflow as tf
+                Interpreter = tf.lite.Interpreter
+                load_delegate = tf.lite.experimental.load_delegate
+
+            model_path = self.model_path
+            if self.backend == 'tflite' and not (model_path and Path(model_path).exists()):
+                model_path = _bundled_landmark_model()
+                logger.info(f"Using MediaPipe's bundled pose model: {model_path}")
+
+            delegates = None
+            if self.backend == 'edgetpu':
+                delegates = [load_delegate('libedgetpu.so.1')]
+
+            # XNNPACK, the default CPU delegate, splits work across num_threads
+            self.interpreter = Interpreter(
+                model_path=model_path,
+                experimental_delegates=delegates,
+                num_threads=4,  # One per Pi Zero 2 W core
+            )
+            self.interpreter.allocate_tensors()
+
+            inp = self.interpreter.get_input_details()[0]
+            self._input_index = inp['index']
+            self._input_dtype = inp['dtype']
+            self._input_quant = inp['quantization']  # (scale, zero_point)
+            _, self._input_h, self._input_w, _ = inp['shape']
+            self._tflite_batch = 1  # Frames the input tensor is sized for
+            self._input_buf = np.empty((1, self._input_h, self._input_w, 3), dtype=self._input_dtype)
+            self._input_lut = _input_lut(self._input_dtype, self._input_quant)
+
+            # Landmarks come as 39 rows of (x, y, z, visibility, presence);
+            # the other scalar output is the pose presence score
+            outputs = self.interpreter.get_output_details()
+            self._landmark_output = next(o for o in outputs if o['shape'][-1] == 39 * 5)
+            self._presence_output = next((o for o in outputs if int(np.prod(o['shape'])) == 1), None)
+
+            logger.info(f"TFLite pose model initialized ({self.backend}, {self._input_w}x{self._input_h})")
+
+        except ImportError:
+            logger.warning("TFLite runtime not available, falling back to simulation")
+            self.interpreter = None
+            self.simulate = True
+
+        except Exception as e:
+            logger.error(f"Failed to initialize TFLite pose model: {e}")
+            self.interpreter = None
+            self.simulate = True
+
+    def _run_tflite(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Run the TFLite landmark model on one frame
+
+        The model is run on the whole frame rather than a detector crop,
+        which suits a desk camera framing one person.
+
+        Args:
+            frame: RGB image from camera (H, W, 3)
+
+        Returns:
+            (33, 4) float32 array of (x, y, z, visibility) per landmark, or
+            None if no person is in view
+        """
+        points, present = self._run_tflite_batch([frame])
+        return points[0] if present[0] else None
+
+    def _run_tflite_batch(self, frames: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the TFLite landmark model on several frames in one invoke
+
+        Args:
+            frames: RGB images from camera (H, W, 3)
+
+        Returns:
+            Tuple of (points, present)
+            - points: (N, 33, 4) float32 array of (x, y, z, visibility)
+            - present: (N,) bool array, False where no person is in view
+        """
+        n = len(frames)
+
+        # Resizing reallocates every tensor, so only do it when N changes
+        if n != self._tflite_batch:
+            self.interpreter.resize_tensor_input(self._input_index, [n, self._input_h, self._input_w, 3])
+            self.interpreter.allocate_tensors()
+            self._input_buf = np.empty((n, self._input_h, self._input_w, 3), dtype=self._input_dtype)
+            self._tflite_batch = n
+
+        # Resize each frame, then scale/quantize it through the lookup table
+        # straight into the input buffer
+        for i, frame in enumerate(frames):
+            np.take(self._input_lut, _resize(frame, self._input_h, self._input_w), out=self._input_buf[i])
+
+        self.interpreter.set_tensor(self._input_index, self._input_buf)
+        self.interpreter.invoke()
+
+        if self._presence_output is not None:
+            presence = _dequantize(self._presence_output,
+                                   self.interpreter.get_tensor(self._presence_output['index']))
+            present = presence.reshape(n) >= 0.5
+        else:
+            present = np.ones(n, dtype=bool)
+
+        raw = self.interpreter.get_tensor(self._landmark_output['index'])
+        points = _dequantize(self._landmark_output, raw).reshape(n, -1, 5)[:, :NUM_LANDMARKS, :4]
+
+        # Pixel coordinates to 0-1, visibility logits to probabilities
+        points[..., 0] /= self._input_w
+        points[..., 1] /= self._input_h
+        points[..., 3] = 1.0 / (1.0 + np.exp(-points[..., 3]))
+
+        return points, present
 
     def _init_mediapipe(self):
         """Initialize MediaPipe Pose"""
         try:
-            import mediapipe as mp
+            mp = _optional_module('mediapipe')
+            if mp is None:
+                raise ImportError("No module named 'mediapipe'")
 
             self.mp_pose = mp.solutions.pose
             self.pose = self.mp_pose.Pose(
+                static_image_mode=self.static_image_mode,
+                smooth_landmarks=True,  # Filter landmark jitter across frames
                 min_detection_confidence=self.confidence_threshold,
                 min_tracking_confidence=self.confidence_threshold,
                 model_complexity=0,  # Lite model for Pi Zero 2 W
@@ -86,19 +275,51 @@ class PoseDetector:
         if self.simulate:
             return self._simulate_detection()
 
-        if frame is None or self.pose is None:
+        if frame is None or (self.pose is None and self.interpreter is None):
             return PostureType.UNKNOWN, 0.0, None
 
+        # The user is listening, not changing posture, while the plant talks
+        if self.pause_event is not None and self.pause_event.is_set():
+            return self._last_result
+
+        # Skip inference while the scene is unchanged since the last detection
+        thumb = _gray_thumbnail(frame)
+        if (self._cache_result is not None and
+                self._cache_hits < self.max_cache_frames and
+                np.mean(np.abs(thumb - self._cache_thumb)) < self.motion_threshold):
+            self._cache_hits += 1
+            return self._cache_result
+
+        result = self._detect_uncached(frame)
+        self._last_result = result
+
+        # Only reuse detections the model was sure of
+        landmarks = result[2]
+        if landmarks is not None and landmarks['visibility'] >= 0.5:
+            self._cache_thumb = thumb
+            self._cache_result = result
+        else:
+            self._cache_result = None
+        self._cache_hits = 0
+
+        return result
+
+    def _detect_uncached(self, frame: np.ndarray) -> Tuple[PostureType, float, Optional[Dict]]:
+        """Run the pose model on a frame (see detect_posture)"""
         try:
-            # Process frame with MediaPipe
-            results = self.pose.process(frame)
+            if self.interpreter is not None:
+                points = self._run_tflite(frame)
+            else:
+                # Process frame with MediaPipe
+                pose_landmarks = self.pose.process(_downscale(frame, _MEDIAPIPE_INPUT_SIZE)).pose_landmarks
+                points = _landmark_array(pose_landmarks) if pose_landmarks else None
 
-            if not results.pose_landmarks:
+            if points is None:
                 # No person detected
                 return PostureType.ABSENT, 0.0, None
 
             # Extract key landmarks
-            landmarks = self._extract_landmarks(results.pose_landmarks)
+            landmarks = self._extract_landmarks(points)
 
             # Analyze posture
             posture, confidence = self._analyze_posture(landmarks)
@@ -109,18 +330,43 @@ class PoseDetector:
             logger.error(f"Pose detection error: {e}")
             return PostureType.UNKNOWN, 0.0, None
 
+    def detect_posture_batch(self, frames: List[np.ndarray]) -> List[Tuple[PostureType, float, Optional[Dict]]]:
+        """
+        Detect posture in a sequence of consecutive frames
+
+        MediaPipe Pose takes one image per call, so frames are processed in
+        order; unless static_image_mode is set, each frame reuses the
+        previous frame's tracking instead of running full detection.
+
+        Args:
+            frames: RGB images from camera, oldest first
+
+        Returns:
+            List of (posture, confidence, landmarks_dict), one per frame
+        """
+        return [self.detect_posture(frame) for frame in frames]
+
+    def _refill_sim_buffers(self):
+        """Draw the next block of random values for simulated detections"""
+        self._sim_uniforms = self._rng.random(_SIM_BUFFER_SIZE).tolist()
+        self._sim_choices = self._rng.integers(0, len(self._sim_postures), size=_SIM_BUFFER_SIZE).tolist()
+        self._sim_idx = 0
+
     def _simulate_detection(self) -> Tuple[PostureType, float, Optional[Dict]]:
         """Simulate pose detection for testing"""
         self._sim_frame_count += 1
 
+        if self._sim_idx == _SIM_BUFFER_SIZE:
+            self._refill_sim_buffers()
+        i = self._sim_idx
+        self._sim_idx += 1
+
         # Change posture every 100 frames (simulated)
         if self._sim_frame_count % 100 == 0:
-            postures = [PostureType.SITTING, PostureType.STANDING, PostureType.LEANING_FORWARD]
-            import random
-            self._sim_posture = random.choice(postures)
+            self._sim_posture = self._sim_postures[self._sim_choices[i]]
 
         # Simulate confidence
-        confidence = 0.85 + (np.random.random() * 0.15)  # 0.85-1.0
+        confidence = 0.85 + self._sim_uniforms[i] * 0.15  # 0.85-1.0
 
         # Simulate landmarks
         mock_landmarks = {
@@ -132,59 +378,39 @@ class PoseDetector:
 
         return self._sim_posture, confidence, mock_landmarks
 
-    def _extract_landmarks(self, pose_landmarks) -> Dict:
+    def _extract_landmarks(self, points: np.ndarray) -> Dict:
         """
-        Extract key landmarks from MediaPipe results
+        Extract key landmarks from pose model output
 
         Args:
-            pose_landmarks: MediaPipe pose landmarks
+            points: (33, 4) array of (x, y, z, visibility) per landmark
 
         Returns:
             Dictionary of key points and measurements
         """
-        landmarks = {}
-
-        # Get landmark indices (MediaPipe standard)
-        NOSE = 0
-        LEFT_SHOULDER = 11
-        RIGHT_SHOULDER = 12
-        LEFT_HIP = 23
-        RIGHT_HIP = 24
-
-        lm = pose_landmarks.landmark
-
-        # Y coordinates (0=top, 1=bottom)
-        landmarks['nose_y'] = lm[NOSE].y
-        landmarks['left_shoulder_y'] = lm[LEFT_SHOULDER].y
-        landmarks['right_shoulder_y'] = lm[RIGHT_SHOULDER].y
-        landmarks['left_hip_y'] = lm[LEFT_HIP].y
-        landmarks['right_hip_y'] = lm[RIGHT_HIP].y
-
-        # Average positions
-        landmarks['shoulder_y'] = (lm[LEFT_SHOULDER].y + lm[RIGHT_SHOULDER].y) / 2
-        landmarks['hip_y'] = (lm[LEFT_HIP].y + lm[RIGHT_HIP].y) / 2
-
-        # Calculate torso angle (forward lean)
-        shoulder_x = (lm[LEFT_SHOULDER].x + lm[RIGHT_SHOULDER].x) / 2
-        hip_x = (lm[LEFT_HIP].x + lm[RIGHT_HIP].x) / 2
-        shoulder_y = landmarks['shoulder_y']
-        hip_y = landmarks['hip_y']
-
-        # Angle from vertical
+        # Rows: nose, left/right shoulder, left/right hip
+        pts = points[_KEY_POINTS]
+        nose_y, l_shoulder_y, r_shoulder_y, l_hip_y, r_hip_y = pts[:, 1].tolist()
+
+        # Average positions; Y runs 0=top to 1=bottom
+        shoulder_x, shoulder_y = pts[1:3, :2].mean(axis=0).tolist()
+        hip_x, hip_y = pts[3:5, :2].mean(axis=0).tolist()
+
+        # Angle from vertical (forward lean)
         dx = shoulder_x - hip_x
         dy = shoulder_y - hip_y
-        landmarks['torso_angle'] = np.degrees(np.arctan2(dx, abs(dy)))
 
-        # Visibility scores (average)
-        landmarks['visibility'] = np.mean([
-            lm[NOSE].visibility,
-            lm[LEFT_SHOULDER].visibility,
-            lm[RIGHT_SHOULDER].visibility,
-            lm[LEFT_HIP].visibility,
-            lm[RIGHT_HIP].visibility,
-        ])
-
-        return landmarks
+        return {
+            'nose_y': nose_y,
+            'left_shoulder_y': l_shoulder_y,
+            'right_shoulder_y': r_shoulder_y,
+            'left_hip_y': l_hip_y,
+            'right_hip_y': r_hip_y,
+            'shoulder_y': shoulder_y,
+            'hip_y': hip_y,
+            'torso_angle': float(np.degrees(np.arctan2(dx, abs(dy)))),
+            'visibility': float(pts[:, 3].mean()),
+        }
 
     def _analyze_posture(self, landmarks: Dict) -> Tuple[PostureType, float]:
         """
@@ -196,74 +422,102 @@ class PoseDetector:
         Returns:
             Tuple of (posture, confidence)
         """
-        # Check visibility
-        if landmarks.get('visibility', 0) < 0.5:
+        # Check visibility; it doubles as the confidence
+        confidence = landmarks.get('visibility', 0)
+        if confidence < 0.5:
             return PostureType.UNKNOWN, 0.0
 
-        nose_y = landmarks['nose_y']
-        shoulder_y = landmarks['shoulder_y']
-        hip_y = landmarks['hip_y']
-        torso_angle = landmarks['torso_angle']
-
-        # Thresholds (tunable based on camera setup)
-        SITTING_THRESHOLD = 0.5  # Hip should be in lower half of frame
-        FORWARD_LEAN_THRESHOLD = 20.0  # degrees from vertical
-
-        confidence = landmarks['visibility']
-
         # Check for poor posture (leaning forward)
-        if abs(torso_angle) > FORWARD_LEAN_THRESHOLD:
+        if abs(landmarks['torso_angle']) > FORWARD_LEAN_THRESHOLD:
             return PostureType.LEANING_FORWARD, confidence
 
         # Determine sitting vs standing based on body position in frame
         # When sitting, body (especially hips) will be in lower portion of frame
         # When standing, body will be more centered/higher
 
-        if hip_y > SITTING_THRESHOLD:
+        if landmarks['hip_y'] > SITTING_THRESHOLD:
             # Hips in lower portion = sitting
             return PostureType.SITTING, confidence
         else:
             # Hips higher = standing
             return PostureType.STANDING, confidence
 
-    def calibrate(self, frames: list) -> Dict:
+    def calibrate(self, frames) -> Dict:
         """
         Calibrate detector based on user's typical positions
 
         Args:
-            frames: List of sample frames showing sitting and standing
+            frames: Sample frames showing sitting and standing, as a list
+                or an (N, H, W, 3) array
 
         Returns:
             Calibration parameters
         """
         logger.info(f"Calibrating with {len(frames)} sample frames...")
 
-        sitting_samples = []
-        standing_samples = []
-
-        for i, frame in enumerate(frames):
-            posture, confidence, landmarks = self.detect_posture(frame)
+        hip_y, confidence, present = self._calibration_samples(frames)
+        usable = present & (confidence >= self.confidence_threshold)
 
-            if confidence < self.confidence_threshold:
-                continue
-
-            # Assume first half are sitting, second half standing
-            if i < len(frames) // 2:
-                sitting_samples.append(landmarks)
-            else:
-                standing_samples.append(landmarks)
+        # Assume first half are sitting, second half standing
+        half = len(frames) // 2
+        sitting = usable[:half]
+        standing = usable[half:]
 
         # Calculate calibration thresholds
         calibration = {
-            'sitting_hip_y_mean': np.mean([s['hip_y'] for s in sitting_samples]) if sitting_samples else 0.6,
-            'standing_hip_y_mean': np.mean([s['hip_y'] for s in standing_samples]) if standing_samples else 0.4,
-            'samples_collected': len(sitting_samples) + len(standing_samples),
+            'sitting_hip_y_mean': float(hip_y[:half][sitting].mean()) if sitting.any() else 0.6,
+            'standing_hip_y_mean': float(hip_y[half:][standing].mean()) if standing.any() else 0.4,
+            'samples_collected': int(np.count_nonzero(usable)),
         }
 
         logger.info(f"Calibration complete: {calibration}")
 
         return calibration
 
+    def _calibration_samples(self, frames) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run pose detection over all calibration frames at once
+
+        The TFLite backends run every frame in a single batched invoke;
+        otherwise frames go through detect_posture_batch.
+
+        Args:
+            frames: Sample frames (list or (N, H, W, 3) array)
+
+        Returns:
+            Tuple of (hip_y, confidence, present) arrays, one entry per frame
+        """
+        if len(frames) == 0:
+            empty = np.empty(0)
+            return empty, empty, empty.astype(bool)
+
+        if self.interpreter is not None and not self.simulate:
+            try:
+                points, present = self._run_tflite_batch(frames)
+                key = points[:, _KEY_POINTS]
+                visibility = key[:, :, 3].mean(axis=1)
+                hip_y = key[:, 3:5, 1].mean(axis=1)
+                # Same rule as _analyze_posture: low visibility scores zero
+                confidence = np.where(visibility >= 0.5, visibility, 0.0)
+                return hip_y, confidence, present
+            except Exception as e:
+                # Edge TPU models are compiled for a fixed batch size
+                logger.warning(f"Batched calibration failed ({e}), running frames one at a time")
+
+        # Fill all three columns in one pass over the results
+        n = len(frames)
+        hip_y = np.full(n, np.nan)
+        confidence = np.zeros(n)
+        present = np.zeros(n, dtype=bool)
+
+        for i, (_, conf, landmarks) in enumerate(self.detect_posture_batch(frames)):
+            confidence[i] = conf
+            if landmarks is not None:
+                hip_y[i] = landmarks['hip_y']
+                present[i] = True
+
+        return hip_y, confidence, present
+
     def close(self):
         """Clean up resources"""
         if self.pose:
@@ -271,9 +525,153 @@ class PoseDetector:
                 self.pose.close()
             except:
                 pass
+        self.interpreter = None
         logger.info("Pose detector closed")
 
 
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """
+    Import an optional dependency on first use
+
+    Failed imports aren't cached by Python, so without this every new
+    detector (and every frame, for cv2) would search sys.path again.
+
+    Args:
+        name: Module name
+
+    Returns:
+        The module, or None if it isn't installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _bundled_landmark_model() -> Optional[str]:
+    """
+    Find the pose landmark lite model shipped inside the mediapipe package,
+    without importing mediapipe itself
+
+    Returns:
+        Model file path, or None if mediapipe isn't installed
+    """
+    spec = importlib.util.find_spec('mediapipe')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    package_dir = Path(next(iter(spec.submodule_search_locations)))
+    path = package_dir / 'modules' / 'pose_landmark' / 'pose_landmark_lite.tflite'
+    return str(path) if path.exists() else None
+
+
+def _landmark_array(pose_landmarks) -> np.ndarray:
+    """
+    Copy MediaPipe pose landmarks into one array
+
+    Args:
+        pose_landmarks: MediaPipe NormalizedLandmarkList
+
+    Returns:
+        (33, 4) float32 array of (x, y, z, visibility) per landmark
+    """
+    return np.fromiter(
+        (v for p in pose_landmarks.landmark for v in (p.x, p.y, p.z, p.visibility)),
+        dtype=np.float32, count=NUM_LANDMARKS * 4,
+    ).reshape(NUM_LANDMARKS, 4)
+
+
+def _gray_thumbnail(frame: np.ndarray) -> np.ndarray:
+    """
+    Downsample an RGB frame to a small grayscale image for change detection
+
+    Args:
+        frame: RGB image (H, W, 3)
+
+    Returns:
+        (_THUMB_SIZE, _THUMB_SIZE) int16 array, so differences don't wrap
+    """
+    cv2 = _optional_module('cv2')
+    if cv2 is not None:
+        gray = cv2.cvtColor(np.ascontiguousarray(frame), cv2.COLOR_RGB2GRAY)
+        thumb = cv2.resize(gray, (_THUMB_SIZE, _THUMB_SIZE), interpolation=cv2.INTER_AREA)
+        return thumb.astype(np.int16)
+
+    # Nearest-neighbour sampling, then BT.601 luma on the few remaining pixels
+    sample = _resize_nearest(frame, _THUMB_SIZE, _THUMB_SIZE)
+    gray = sample @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return gray.astype(np.int16)
+
+
+def _downscale(frame: np.ndarray, max_side: int) -> np.ndarray:
+    """
+    Shrink a frame so neither side exceeds max_side, keeping aspect ratio
+
+    Args:
+        frame: RGB image (H, W, 3)
+        max_side: Largest allowed height or width
+
+    Returns:
+        C-contiguous RGB image; the input itself if already small enough
+    """
+    h, w = frame.shape[:2]
+    if h <= max_side and w <= max_side:
+        return np.ascontiguousarray(frame)
+
+    scale = max_side / max(h, w)
+    new_h, new_w = max(1, round(h * scale)), max(1, round(w * scale))
+
+    cv2 = _optional_module('cv2')
+    if cv2 is not None:
+        return cv2.resize(np.ascontiguousarray(frame), (new_w, new_h), interpolation=cv2.INTER_AREA)
+    return np.ascontiguousarray(_resize_nearest(frame, new_h, new_w))
+
+
+def _input_lut(dtype, quantization: Tuple[float, int]) -> np.ndarray:
+    """
+    Map every 0-255 pixel value to its model input value
+
+    Args:
+        dtype: Input tensor dtype (float32, uint8 or int8)
+        quantization: Input tensor (scale, zero_point)
+
+    Returns:
+        256-entry array of the input dtype
+    """
+    pixels = np.arange(256, dtype=np.float32) / 255.0
+    if dtype == np.float32:
+        return pixels
+
+    # Quantize 0-1 pixel values into the model's integer input range
+    scale, zero_point = quantization
+    info = np.iinfo(dtype)
+    return np.clip(np.round(pixels / scale + zero_point), info.min, info.max).astype(dtype)
+
+
+def _resize(frame: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Resize an (H, W, 3) uint8 image exactly, with cv2 if it's installed"""
+    cv2 = _optional_module('cv2')
+    if cv2 is not None:
+        return cv2.resize(np.ascontiguousarray(frame), (width, height), interpolation=cv2.INTER_AREA)
+    return _resize_nearest(frame, height, width)
+
+
+def _resize_nearest(frame: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Nearest-neighbour resize of an (H, W, C) image by index gathering"""
+    rows = np.arange(height) * frame.shape[0] // height
+    cols = np.arange(width) * frame.shape[1] // width
+    return frame[rows[:, np.newaxis], cols]
+
+
+def _dequantize(detail: Dict, values: np.ndarray) -> np.ndarray:
+    """Convert a TFLite output tensor to float using its quantization params"""
+    scale, zero_point = detail['quantization']
+    if not scale:
+        return values.astype(np.float32)
+    return (values.astype(np.float32) - zero_point) * scale
+
+
 if __name__ == '__main__':
     """Test pose detector"""
     logging.basicConfig(level=logging.INFO)
@@ -283,14 +681,17 @@ if __name__ == '__main__':
 
     print("=== POSE DETECTOR TEST ===\n")
 
+    # Simulated frame, allocated once; one byte changes per iteration
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+
     # Test detections
     for i in range(10):
-        # Simulate frame
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+        frame[0, 0, 0] ^= 1
 
         posture, confidence, landmarks = detector.detect_posture(frame)
 
-        print(f"Frame {i+1:2d}: {posture.value:15s} (confidence: {confidence:.2f})")
+        print(f"Frame {i+1:2d}: {posture.name.lower():15s} (confidence: {confidence:.2f})")
 
         if landmarks:
             print(f"          Torso angle: {landmarks['torso_angle']:.1f}°")
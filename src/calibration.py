@@ -3,15 +3,28 @@ Interactive Calibration System
 Guides users through personalized setup and calibration
 """
 
+import os
 import json
 import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Optional, List
 from datetime import datetime
 
+import numpy as np
+
+from personality import get_pattern, ColorPalette
+
 logger = logging.getLogger(__name__)
 
+# orjson is several times faster than the stdlib encoder; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class CalibrationData:
     """Stores calibration data"""
@@ -26,6 +39,8 @@ class CalibrationData:
         self.data_directory = Path(data_directory)
         self.calibration_file = self.data_directory / 'calibration.json'
         self.data = self._load()
+        self._deferred = False  # Inside defer_saves()
+        self._save_pending = False  # save() called while deferred
 
     def _load(self) -> Dict:
         """Load existing calibration data"""
@@ -33,10 +48,9 @@ class CalibrationData:
             return self._get_defaults()
 
         try:
-            with open(self.calibration_file, 'r') as f:
-                data = json.load(f)
-                logger.info("Loaded existing calibration data")
-                return data
+            data = _loads(self.calibration_file.read_bytes())
+            logger.info("Loaded existing calibration data")
+            return data
         except Exception as e:
             logger.error(f"Failed to load calibration: {e}")
             return self._get_defaults()
@@ -66,18 +80,46 @@ class CalibrationData:
         }
 
     def save(self):
-        """Save calibration data"""
+        """Save calibration data (postponed while inside defer_saves())"""
+        if self._deferred:
+            self._save_pending = True
+            return
+
         try:
             self.data['last_updated'] = datetime.now().isoformat()
 
-            with open(self.calibration_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Write a temp file and rename it over the old one, so a crash
+            # mid-write never leaves a truncated calibration file
+            tmp_file = self.calibration_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(_dumps(self.data))
+            os.replace(tmp_file, self.calibration_file)
 
             logger.info("Calibration data saved")
 
         except Exception as e:
             logger.error(f"Failed to save calibration: {e}")
 
+    @contextmanager
+    def defer_saves(self):
+        """
+        Collect save() calls made inside the block into one write
+
+        The write happens when the block exits, even on an exception, so
+        completed steps are kept.
+        """
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self.flush()
+
+    def flush(self):
+        """Write any save postponed by defer_saves()"""
+        if self._save_pending:
+            self._save_pending = False
+            self.save()
+
     def mark_calibrated(self):
         """Mark calibration as complete"""
         self.data['calibrated'] = True
@@ -107,6 +149,20 @@ class CalibrationData:
         return self.data.get('preferences', {})
 
 
+def _dumps(obj) -> bytes:
+    """Encode to indented JSON bytes (numpy scalars allowed with orjson)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes):
+    """Decode JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CalibrationWizard:
     """Interactive calibration wizard"""
 
@@ -128,6 +184,9 @@ class CalibrationWizard:
         self.audio = audio_system
         self.pose = pose_detector
 
+        # One worker, so overlapped speech never talks over itself
+        self._pool = ThreadPoolExecutor(max_workers=1)
+
     def run_full_calibration(self, interactive: bool = True) -> bool:
         """
         Run complete calibration process
@@ -140,6 +199,12 @@ class CalibrationWizard:
         """
         logger.info("Starting calibration wizard...")
 
+        # Each step saves its results; write them to the SD card once
+        with self.calibration.defer_saves():
+            return self._run_steps(interactive)
+
+    def _run_steps(self, interactive: bool) -> bool:
+        """Run the calibration steps (see run_full_calibration)"""
         try:
             if interactive:
                 self._welcome()
@@ -176,6 +241,18 @@ class CalibrationWizard:
             logger.error(f"Calibration failed: {e}", exc_info=True)
             return False
 
+    def _speak_async(self, text: str) -> Future:
+        """
+        Start speaking on the worker thread so the next step can run meanwhile
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            Future to wait on before speaking again or prompting for input
+        """
+        return self._pool.submit(self.audio.speak, text)
+
     def _welcome(self):
         """Welcome message"""
         print("\n" + "=" * 60)
@@ -184,8 +261,9 @@ class CalibrationWizard:
         print("\nLet's calibrate your AI companion for the best experience.")
         print("This will take about 5 minutes.\n")
 
-        self.audio.speak("Hello! Welcome to Pixel Plant setup!")
+        speech = self._speak_async("Hello! Welcome to Pixel Plant setup!")
         time.sleep(1)
+        speech.result()
 
         input("Press Enter to begin...")
         print()
@@ -200,10 +278,11 @@ class CalibrationWizard:
             return
 
         print("\nChecking camera orientation...")
-        self.audio.speak("Let me check the camera")
+        speech = self._speak_async("Let me check the camera")
 
         self.camera.start()
         time.sleep(1)
+        speech.result()
 
         frame = self.camera.capture_frame()
 
@@ -214,8 +293,8 @@ class CalibrationWizard:
         print("✓ Camera working")
 
         # Check if image is too dark or bright
-        import numpy as np
-        brightness = np.mean(frame)
+        # Every 10th pixel each way is plenty for an average; ~1% of the reads
+        brightness = float(frame[::10, ::10].mean())
 
         print(f"\nImage brightness: {brightness:.1f}/255")
 
@@ -257,9 +336,7 @@ class CalibrationWizard:
             self.led.set_brightness(128)
             return
 
-        self.audio.speak("Let's set the LED brightness")
-
-        from personality import get_pattern, ColorPalette
+        speech = self._speak_async("Let's set the LED brightness")
 
         pattern = get_pattern('happy')
         palette = ColorPalette.HAPPY
@@ -274,6 +351,8 @@ class CalibrationWizard:
             print(f"\nBrightness: {brightness}/255")
             time.sleep(1.5)
 
+        speech.result()
+
         # Get user preference
         print("\nWhat brightness level looked best?")
         print("1. Dim (64)")
@@ -349,43 +428,47 @@ class CalibrationWizard:
         print("\nThis helps me recognize when you're sitting or standing.")
         print("I'll capture a few samples of each position.\n")
 
-        # Collect sitting samples
-        sitting_frames = []
+        # Sitting then standing samples, captured straight into one block
+        samples_per_pose = 10
+        width, height = self.camera.get_frame_size()
+        frames = np.empty((2 * samples_per_pose, height, width, 3), dtype=np.uint8)
+        count = 0
 
+        # Collect sitting samples
         print("Please SIT in your normal working position.")
         input("Press Enter when ready...")
 
         print("Capturing sitting position... (stay still for 3 seconds)")
-        self.audio.speak("Capturing sitting position")
+        speech = self._speak_async("Capturing sitting position")
 
-        for i in range(10):
-            frame = self.camera.capture_frame()
-            if frame is not None:
-                sitting_frames.append(frame)
+        for i in range(samples_per_pose):
+            if self.camera.capture_frame(out=frames[count]) is not None:
+                count += 1
             time.sleep(0.3)
 
-        print(f"✓ Captured {len(sitting_frames)} sitting samples")
+        speech.result()
 
-        # Collect standing samples
-        standing_frames = []
+        sitting_count = count
+        print(f"✓ Captured {sitting_count} sitting samples")
 
+        # Collect standing samples
         print("\nNow please STAND UP.")
         input("Press Enter when standing...")
 
         print("Capturing standing position... (stay still for 3 seconds)")
-        self.audio.speak("Capturing standing position")
+        speech = self._speak_async("Capturing standing position")
 
-        for i in range(10):
-            frame = self.camera.capture_frame()
-            if frame is not None:
-                standing_frames.append(frame)
+        for i in range(samples_per_pose):
+            if self.camera.capture_frame(out=frames[count]) is not None:
+                count += 1
             time.sleep(0.3)
 
-        print(f"✓ Captured {len(standing_frames)} standing samples")
+        speech.result()
+
+        print(f"✓ Captured {count - sitting_count} standing samples")
 
         # Analyze calibration
-        all_frames = sitting_frames + standing_frames
-        pose_calibration = self.pose.calibrate(all_frames)
+        pose_calibration = self.pose.calibrate(frames[:count])
 
         self.calibration.update_pose_calibration(pose_calibration)
 
@@ -434,14 +517,14 @@ class CalibrationWizard:
         print("\nYou can recalibrate anytime by running:")
         print("  python -m calibration\n")
 
-        self.audio.speak("Calibration complete! I'm ready to care for you!")
+        speech = self._speak_async("Calibration complete! I'm ready to care for you!")
 
-        from personality import get_pattern, ColorPalette
         pattern = get_pattern('very_happy')
         palette = ColorPalette.CELEBRATING
         self.led.show_pattern(pattern, palette)
 
         time.sleep(2)
+        speech.result()
 
 
 def run_calibration_wizard(config):
@@ -474,7 +557,10 @@ def run_calibration_wizard(config):
 
     pose = PoseDetector(
         confidence_threshold=config.ai.confidence_threshold,
-        simulate=config.debug.simulate_hardware
+        simulate=config.debug.simulate_hardware,
+        backend=config.ai.pose_backend,
+        model_path=config.ai.model_path,
+        pause_event=audio.speaking
     )
 
     # Create calibration data
@@ -3,77 +3,217 @@ Configuration Management
 Loads and validates configuration from YAML file
 """
 
+import io
 import os
+import json
 import yaml
 import logging
+import threading
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import MISSING, FrozenInstanceError, dataclass, field, fields
+from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Resolved once, so relative paths in the config don't depend on the cwd
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CONFIG_PATH = PROJECT_ROOT / 'config' / 'config.yaml'
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+
+
+@dataclass(frozen=True)
+class _Check:
+    """Allowed values for one config field"""
+    label: str
+    lo: Optional[float] = None
+    hi: Optional[float] = None
+    choices: Optional[tuple] = None
+    warn: bool = False  # Report as a warning rather than an error
+    hint: str = ''
+
+    def problem(self, value) -> Optional[str]:
+        """Describe why value is not allowed, or None if it is"""
+        if self.choices is not None:
+            if value in self.choices:
+                return None
+            names = [str(c) for c in self.choices]
+            if all(isinstance(c, (int, float)) for c in self.choices):
+                expected = ", ".join(names[:-1]) + ", or " + names[-1]  # e.g. 0, 90, 180, or 270
+            else:
+                expected = "one of: " + ", ".join(names)
+        elif (self.lo is None or value >= self.lo) and (self.hi is None or value <= self.hi):
+            return None
+        elif self.hi is None:
+            expected = f"at least {self.lo}"
+        elif self.lo is None:
+            expected = f"at most {self.hi}"
+        else:
+            expected = f"{self.lo}-{self.hi}"
+
+        message = f"{self.label} {'should' if self.warn else 'must'} be {expected}, got {value!r}"
+        return f"{message}. {self.hint}" if self.hint else message
+
+
+def _checked(label: str, lo=None, hi=None, choices: Optional[tuple] = None,
+             warn: bool = False, hint: str = '', key: Tuple[str, ...] = (), **kwargs):
+    """Dataclass field whose allowed values are checked by Config.validate()"""
+    check = _Check(label, lo, hi, choices, warn, hint)
+    return field(metadata={'check': check, 'key': key}, **kwargs)
+
+
+def _at(*key: str):
+    """Dataclass field read from a nested YAML key within its section"""
+    return field(metadata={'key': key})
+
+
+def _slotted(cls):
+    """
+    Rebuild a frozen dataclass with __slots__, so instances carry no
+    __dict__ (what dataclass(slots=True) does on Python 3.10+)
+
+    Args:
+        cls: Frozen dataclass without zero-argument super() calls
+
+    Returns:
+        Equivalent class whose fields are slots
+    """
+    names = tuple(f.name for f in fields(cls))
+    body = {k: v for k, v in cls.__dict__.items()
+            if k not in names and k not in ('__dict__', '__weakref__')}
+    body['__slots__'] = names
 
-@dataclass
+    # The generated frozen __setattr__ refers to the original class, so
+    # replace it; copy and pickle then restore state via object.__setattr__
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in names]
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    body.update(__setattr__=__setattr__, __delattr__=__delattr__,
+                __getstate__=__getstate__, __setstate__=__setstate__)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, body)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+# BCM GPIO numbers usable on the 40-pin header
+_GPIO_RANGE = (2, 27)
+
+# Header pins with a fixed function on the Pi
+_RESERVED_PINS = {
+    0: "I2C ID EEPROM",
+    1: "I2C ID EEPROM",
+    14: "UART TX",
+    15: "UART RX",
+}
+
+
+# Sections are slotted (no per-instance __dict__) and read-only once
+# built; __post_init__ normalizes fields via object.__setattr__
+@_slotted
+@dataclass(frozen=True)
 class HardwareConfig:
     """Hardware pin assignments and settings"""
-    led_gpio_pin: int
-    led_width: int
-    led_height: int
-    led_brightness: int
+    led_gpio_pin: int = _checked("LED GPIO pin", *_GPIO_RANGE, key=('led_matrix', 'gpio_pin'))
+    led_width: int = _at('led_matrix', 'width')
+    led_height: int = _at('led_matrix', 'height')
+    led_brightness: int = _checked("LED brightness", 0, 255, key=('led_matrix', 'brightness'))
+
+    audio_bclk_pin: int = _at('audio', 'i2s_pins', 'bclk')
+    audio_lrclk_pin: int = _at('audio', 'i2s_pins', 'lrclk')
+    audio_data_pin: int = _at('audio', 'i2s_pins', 'data')
+    audio_volume: int = _checked("Audio volume", 0, 100, key=('audio', 'volume'))
 
-    audio_bclk_pin: int
-    audio_lrclk_pin: int
-    audio_data_pin: int
-    audio_volume: int
+    camera_resolution: tuple[int, int] = _at('camera', 'resolution')
+    camera_framerate: int = _checked("Camera framerate", 1, 30, warn=True,
+                                     hint="Recommended: 10-25 FPS", key=('camera', 'framerate'))
+    camera_rotation: int = _checked("Camera rotation", choices=(0, 90, 180, 270),
+                                    key=('camera', 'rotation'))
 
-    camera_resolution: tuple[int, int]
-    camera_framerate: int
-    camera_rotation: int
+    pir_gpio_pin: int = _checked("PIR GPIO pin", *_GPIO_RANGE, key=('pir_sensor', 'gpio_pin'))
+    pir_enabled: bool = _at('pir_sensor', 'enabled')
 
-    pir_gpio_pin: int
-    pir_enabled: bool
+    def __post_init__(self):
+        # YAML/JSON give a list
+        object.__setattr__(self, 'camera_resolution', tuple(self.camera_resolution))
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class BehaviorConfig:
     """Behavioral monitoring thresholds"""
-    sitting_threshold_minutes: int
-    hydration_interval_minutes: int
-    inactivity_sleep_minutes: int
+    sitting_threshold_minutes: int = _checked("Sitting threshold (minutes)", lo=1)
+    hydration_interval_minutes: int = _checked("Hydration interval (minutes)", lo=1)
+    inactivity_sleep_minutes: int = _checked("Inactivity sleep (minutes)", lo=1)
     learning_enabled: bool
-    pattern_window_days: int
+    pattern_window_days: int = _checked("Pattern window (days)", 1, 30, warn=True,
+                                        hint="Recommended: 3-14 days")
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class PersonalityConfig:
     """Personality and interaction settings"""
-    caring_level: int
+    caring_level: int = _checked("Caring level", 1, 10)
     voice_enabled: bool
-    voice_rate: int
-    voice_volume: float
+    voice_rate: int = _checked("Voice rate (WPM)", 50, 300, warn=True,
+                               hint="Recommended: 100-200 WPM")
+    voice_volume: float = _checked("Voice volume", 0.0, 1.0)
     escalation_enabled: bool
     celebration_enabled: bool
+    voice_cache_enabled: bool = False
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class AnimationConfig:
     """LED animation preferences"""
-    transition_style: str
-    mood_update_seconds: int
-    breathing_speed: float
+    transition_style: str = _checked("Transition style",
+                                     choices=('wave', 'cascade', 'synchronized', 'breathing'))
+    mood_update_seconds: int = _checked("Mood update interval (seconds)", lo=1, warn=True,
+                                        hint="Shorter intervals cause excessive LED updates")
+    breathing_speed: float = _checked("Breathing speed (seconds)", 0.5, 10, warn=True,
+                                      hint="Recommended: 1-5 seconds")
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class AIConfig:
     """AI/ML settings"""
     pose_detection_enabled: bool
-    confidence_threshold: float
+    confidence_threshold: float = _checked("AI confidence threshold", 0.0, 1.0)
     model_path: str
     save_images: bool
     save_analytics_only: bool
+    pose_backend: str = _checked("AI pose backend",
+                                 choices=('mediapipe', 'tflite', 'tflite_int8', 'edgetpu'),
+                                 default='mediapipe')
+
+    def __post_init__(self):
+        # Resolve model path relative to project root
+        if not self.model_path.startswith('/'):
+            object.__setattr__(self, 'model_path', os.path.join(_PROJECT_ROOT_STR, self.model_path))
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class SystemConfig:
     """System-level settings"""
     log_level: str
@@ -81,8 +221,12 @@ class SystemConfig:
     data_directory: str
     auto_start: bool
 
+    def __post_init__(self):
+        object.__setattr__(self, 'data_directory', str(Path(self.data_directory).expanduser()))
+
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class DebugConfig:
     """Development and debugging options"""
     simulate_hardware: bool
@@ -90,9 +234,40 @@ class DebugConfig:
     performance_monitoring: bool
 
 
+# Config attribute holding each section, with its dataclass
+_SECTIONS = (
+    ('hardware', HardwareConfig),
+    ('behavior', BehaviorConfig),
+    ('personality', PersonalityConfig),
+    ('animations', AnimationConfig),
+    ('ai', AIConfig),
+    ('system', SystemConfig),
+    ('debug', DebugConfig),
+)
+
+# Schema walked once at import: (YAML key path, has default) per field of
+# each section, and a (getter, check) pair per _checked() field
+_SECTION_KEYS = {
+    cls: tuple(
+        (f.name, f.metadata.get('key') or (f.name,), f.default is not MISSING)
+        for f in fields(cls)
+    )
+    for _, cls in _SECTIONS
+}
+_FIELD_CHECKS = tuple(
+    (attrgetter(f"{name}.{f.name}"), f.metadata['check'])
+    for name, cls in _SECTIONS
+    for f in fields(cls)
+    if f.metadata.get('check') is not None
+)
+
+
 class Config:
     """Main configuration object"""
 
+    __slots__ = ('config_path', '_cache_key', '_validation_errors', '_validation_warnings',
+                 *(name for name, _ in _SECTIONS))
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Load configuration from YAML file
@@ -101,21 +276,22 @@ class Config:
             config_path: Path to config.yaml (defaults to config/config.yaml)
         """
         if config_path is None:
-            # Default to config/config.yaml relative to project root
-            project_root = Path(__file__).parent.parent
-            config_path = project_root / 'config' / 'config.yaml'
+            config_path = DEFAULT_CONFIG_PATH
 
         self.config_path = Path(config_path)
-        self._raw_config = self._load_yaml()
+        raw = self._load_yaml()
 
-        # Parse into structured config objects
-        self.hardware = self._parse_hardware()
-        self.behavior = self._parse_behavior()
-        self.personality = self._parse_personality()
-        self.animations = self._parse_animations()
-        self.ai = self._parse_ai()
-        self.system = self._parse_system()
-        self.debug = self._parse_debug()
+        # Build structured config objects straight from the YAML sections
+        self.hardware = _from_section(HardwareConfig, raw['hardware'])
+        self.behavior = _from_section(BehaviorConfig, raw['behavior'])
+        self.personality = _from_section(PersonalityConfig, raw['personality'])
+        self.animations = _from_section(AnimationConfig, raw['animations'])
+        self.ai = _from_section(AIConfig, raw['ai'])
+        self.system = _from_section(SystemConfig, raw['system'])
+        self.debug = _from_section(DebugConfig, raw['debug'])
+
+        # Ensure data directory exists
+        Path(self.system.data_directory).mkdir(parents=True, exist_ok=True)
 
         # Validate configuration
         self._validation_errors = []
@@ -134,233 +310,75 @@ class Config:
             raise ValueError(error_msg)
 
     def _load_yaml(self) -> dict:
-        """Load and parse YAML configuration file"""
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
-
-    def _parse_hardware(self) -> HardwareConfig:
-        """Parse hardware configuration section"""
-        hw = self._raw_config['hardware']
-        return HardwareConfig(
-            led_gpio_pin=hw['led_matrix']['gpio_pin'],
-            led_width=hw['led_matrix']['width'],
-            led_height=hw['led_matrix']['height'],
-            led_brightness=hw['led_matrix']['brightness'],
-
-            audio_bclk_pin=hw['audio']['i2s_pins']['bclk'],
-            audio_lrclk_pin=hw['audio']['i2s_pins']['lrclk'],
-            audio_data_pin=hw['audio']['i2s_pins']['data'],
-            audio_volume=hw['audio']['volume'],
-
-            camera_resolution=tuple(hw['camera']['resolution']),
-            camera_framerate=hw['camera']['framerate'],
-            camera_rotation=hw['camera']['rotation'],
-
-            pir_gpio_pin=hw['pir_sensor']['gpio_pin'],
-            pir_enabled=hw['pir_sensor']['enabled'],
-        )
-
-    def _parse_behavior(self) -> BehaviorConfig:
-        """Parse behavior configuration section"""
-        b = self._raw_config['behavior']
-        return BehaviorConfig(
-            sitting_threshold_minutes=b['sitting_threshold_minutes'],
-            hydration_interval_minutes=b['hydration_interval_minutes'],
-            inactivity_sleep_minutes=b['inactivity_sleep_minutes'],
-            learning_enabled=b['learning_enabled'],
-            pattern_window_days=b['pattern_window_days'],
-        )
-
-    def _parse_personality(self) -> PersonalityConfig:
-        """Parse personality configuration section"""
-        p = self._raw_config['personality']
-        return PersonalityConfig(
-            caring_level=p['caring_level'],
-            voice_enabled=p['voice_enabled'],
-            voice_rate=p['voice_rate'],
-            voice_volume=p['voice_volume'],
-            escalation_enabled=p['escalation_enabled'],
-            celebration_enabled=p['celebration_enabled'],
-        )
+        """
+        Load and parse YAML configuration file
 
-    def _parse_animations(self) -> AnimationConfig:
-        """Parse animation configuration section"""
-        a = self._raw_config['animations']
-        return AnimationConfig(
-            transition_style=a['transition_style'],
-            mood_update_seconds=a['mood_update_seconds'],
-            breathing_speed=a['breathing_speed'],
-        )
+        The parsed result is kept in a JSON sidecar (config.yaml.cache.json)
+        stamped with the YAML file's mtime and size; while those match,
+        the sidecar is read instead, since JSON decodes far faster than YAML.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-    def _parse_ai(self) -> AIConfig:
-        """Parse AI configuration section"""
-        ai = self._raw_config['ai']
+        # Identifies the file contents this Config was built from
+        self._cache_key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-        # Resolve model path relative to project root
-        model_path = ai['model_path']
-        if not model_path.startswith('/'):
-            project_root = Path(__file__).parent.parent
-            model_path = str(project_root / model_path)
-
-        return AIConfig(
-            pose_detection_enabled=ai['pose_detection_enabled'],
-            confidence_threshold=ai['confidence_threshold'],
-            model_path=model_path,
-            save_images=ai['save_images'],
-            save_analytics_only=ai['save_analytics_only'],
-        )
+        cache_path = self.config_path.with_suffix('.yaml.cache.json')
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                return cached['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, stale format, or corrupt: reparse
 
-    def _parse_system(self) -> SystemConfig:
-        """Parse system configuration section"""
-        s = self._raw_config['system']
+        with open(self.config_path, 'rb') as f:
+            data = yaml.load(f, Loader=YamlLoader)
 
-        # Ensure data directory exists
-        data_dir = Path(s['data_directory']).expanduser()
-        data_dir.mkdir(parents=True, exist_ok=True)
-
-        return SystemConfig(
-            log_level=s['log_level'],
-            log_file=s['log_file'],
-            data_directory=str(data_dir),
-            auto_start=s['auto_start'],
-        )
+        # Best effort: a read-only config directory just means no cache
+        try:
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(
+                {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'data': data}))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache: {e}")
 
-    def _parse_debug(self) -> DebugConfig:
-        """Parse debug configuration section"""
-        d = self._raw_config['debug']
-        return DebugConfig(
-            simulate_hardware=d['simulate_hardware'],
-            console_visualization=d['console_visualization'],
-            performance_monitoring=d['performance_monitoring'],
-        )
+        return data
 
     def validate(self):
         """Validate configuration values"""
+        # Per-field limits declared on the config dataclasses
+        for get, check in _FIELD_CHECKS:
+            problem = check.problem(get(self))
+            if problem:
+                if check.warn:
+                    self._validation_warnings.append(problem)
+                else:
+                    self._validation_errors.append(problem)
+
+        # Checks spanning fields or touching the filesystem
         self._validate_hardware()
-        self._validate_behavior()
-        self._validate_personality()
-        self._validate_animations()
         self._validate_ai()
         self._validate_gpio_conflicts()
 
     def _validate_hardware(self):
         """Validate hardware configuration"""
-        # GPIO pins
-        valid_gpio_pins = list(range(2, 28))  # BCM numbering
-
-        if self.hardware.led_gpio_pin not in valid_gpio_pins:
-            self._validation_errors.append(
-                f"Invalid LED GPIO pin: {self.hardware.led_gpio_pin}. Must be 2-27."
-            )
-
-        if self.hardware.pir_gpio_pin not in valid_gpio_pins:
-            self._validation_errors.append(
-                f"Invalid PIR GPIO pin: {self.hardware.pir_gpio_pin}. Must be 2-27."
-            )
-
-        # LED settings
-        if not (0 <= self.hardware.led_brightness <= 255):
-            self._validation_errors.append(
-                f"LED brightness must be 0-255, got {self.hardware.led_brightness}"
-            )
-
         if self.hardware.led_width != 8 or self.hardware.led_height != 8:
             self._validation_warnings.append(
                 f"LED matrix is {self.hardware.led_width}x{self.hardware.led_height}. "
                 "Patterns are designed for 8x8."
             )
 
-        # Audio settings
-        if not (0 <= self.hardware.audio_volume <= 100):
-            self._validation_errors.append(
-                f"Audio volume must be 0-100, got {self.hardware.audio_volume}"
-            )
-
-        # Camera settings
-        if self.hardware.camera_rotation not in [0, 90, 180, 270]:
-            self._validation_errors.append(
-                f"Camera rotation must be 0, 90, 180, or 270, got {self.hardware.camera_rotation}"
-            )
-
-        if self.hardware.camera_framerate < 1 or self.hardware.camera_framerate > 30:
-            self._validation_warnings.append(
-                f"Camera framerate {self.hardware.camera_framerate} may cause issues. "
-                "Recommended: 10-25 FPS"
-            )
-
-    def _validate_behavior(self):
-        """Validate behavior configuration"""
-        if self.behavior.sitting_threshold_minutes < 1:
-            self._validation_errors.append(
-                "Sitting threshold must be at least 1 minute"
-            )
-
-        if self.behavior.hydration_interval_minutes < 1:
-            self._validation_errors.append(
-                "Hydration interval must be at least 1 minute"
-            )
-
-        if self.behavior.inactivity_sleep_minutes < 1:
-            self._validation_errors.append(
-                "Inactivity sleep must be at least 1 minute"
-            )
-
-        if self.behavior.pattern_window_days < 1 or self.behavior.pattern_window_days > 30:
-            self._validation_warnings.append(
-                f"Pattern window of {self.behavior.pattern_window_days} days may be extreme. "
-                "Recommended: 3-14 days"
-            )
-
-    def _validate_personality(self):
-        """Validate personality configuration"""
-        if not (1 <= self.personality.caring_level <= 10):
-            self._validation_errors.append(
-                f"Caring level must be 1-10, got {self.personality.caring_level}"
-            )
-
-        if not (50 <= self.personality.voice_rate <= 300):
-            self._validation_warnings.append(
-                f"Voice rate {self.personality.voice_rate} WPM may sound unnatural. "
-                "Recommended: 100-200 WPM"
-            )
-
-        if not (0.0 <= self.personality.voice_volume <= 1.0):
-            self._validation_errors.append(
-                f"Voice volume must be 0.0-1.0, got {self.personality.voice_volume}"
-            )
-
-    def _validate_animations(self):
-        """Validate animation configuration"""
-        valid_styles = ['wave', 'cascade', 'synchronized', 'breathing']
-
-        if self.animations.transition_style not in valid_styles:
-            self._validation_errors.append(
-                f"Invalid transition style: '{self.animations.transition_style}'. "
-                f"Must be one of: {', '.join(valid_styles)}"
-            )
-
-        if self.animations.mood_update_seconds < 1:
-            self._validation_warnings.append(
-                "Mood update interval < 1s may cause excessive LED updates"
-            )
-
-        if self.animations.breathing_speed < 0.5 or self.animations.breathing_speed > 10:
-            self._validation_warnings.append(
-                f"Breathing speed {self.animations.breathing_speed}s may look unnatural. "
-                "Recommended: 1-5 seconds"
-            )
-
     def _validate_ai(self):
         """Validate AI configuration"""
-        if not (0.0 <= self.ai.confidence_threshold <= 1.0):
-            self._validation_errors.append(
-                f"AI confidence threshold must be 0.0-1.0, got {self.ai.confidence_threshold}"
-            )
+        if not self.ai.pose_detection_enabled:
+            return
 
-        if self.ai.pose_detection_enabled and not Path(self.ai.model_path).exists():
+        try:
+            os.stat(self.ai.model_path)
+        except OSError:
             self._validation_warnings.append(
                 f"Pose detection model not found at: {self.ai.model_path}. "
                 "Pose detection will be disabled."
@@ -368,38 +386,28 @@ class Config:
 
     def _validate_gpio_conflicts(self):
         """Check for GPIO pin conflicts"""
-        gpio_usage = {}
-
-        # Track GPIO usage
-        pins = [
+        pins = (
             (self.hardware.led_gpio_pin, "LED Matrix"),
             (self.hardware.pir_gpio_pin, "PIR Sensor"),
             (self.hardware.audio_bclk_pin, "Audio BCLK"),
             (self.hardware.audio_lrclk_pin, "Audio LRCLK"),
             (self.hardware.audio_data_pin, "Audio Data"),
-        ]
+        )
 
-        for pin, component in pins:
-            if pin in gpio_usage:
-                self._validation_errors.append(
-                    f"GPIO pin conflict: GPIO {pin} used by both "
-                    f"'{gpio_usage[pin]}' and '{component}'"
-                )
-            else:
-                gpio_usage[pin] = component
+        for pin, uses in Counter(pin for pin, _ in pins).items():
+            if uses > 1:
+                first, *others = [component for p, component in pins if p == pin]
+                for component in others:
+                    self._validation_errors.append(
+                        f"GPIO pin conflict: GPIO {pin} used by both "
+                        f"'{first}' and '{component}'"
+                    )
 
         # Warn about reserved pins
-        reserved_pins = {
-            0: "I2C ID EEPROM",
-            1: "I2C ID EEPROM",
-            14: "UART TX",
-            15: "UART RX",
-        }
-
         for pin, component in pins:
-            if pin in reserved_pins:
+            if pin in _RESERVED_PINS:
                 self._validation_warnings.append(
-                    f"GPIO {pin} ({component}) conflicts with {reserved_pins[pin]}"
+                    f"GPIO {pin} ({component}) conflicts with {_RESERVED_PINS[pin]}"
                 )
 
     def get_validation_report(self) -> str:
@@ -409,55 +417,109 @@ class Config:
         Returns:
             Multi-line string with validation results
         """
-        report = ["Configuration Validation Report", "=" * 40]
+        buf = io.StringIO()
+        write = buf.write
+        write("Configuration Validation Report\n" + "=" * 40)
 
         if not self._validation_errors and not self._validation_warnings:
-            report.append("✅ All validation checks passed!")
+            write("\n✅ All validation checks passed!")
         else:
             if self._validation_errors:
-                report.append(f"\n❌ Errors ({len(self._validation_errors)}):")
+                write(f"\n\n❌ Errors ({len(self._validation_errors)}):")
                 for error in self._validation_errors:
-                    report.append(f"  - {error}")
+                    write(f"\n  - {error}")
 
             if self._validation_warnings:
-                report.append(f"\n⚠️  Warnings ({len(self._validation_warnings)}):")
+                write(f"\n\n⚠️  Warnings ({len(self._validation_warnings)}):")
                 for warning in self._validation_warnings:
-                    report.append(f"  - {warning}")
+                    write(f"\n  - {warning}")
 
-        return "\n".join(report)
+        return buf.getvalue()
 
     def __repr__(self) -> str:
         """String representation for debugging"""
-        return (
-            f"Config(\n"
-            f"  hardware={self.hardware},\n"
-            f"  behavior={self.behavior},\n"
-            f"  personality={self.personality},\n"
-            f"  animations={self.animations},\n"
-            f"  ai={self.ai},\n"
-            f"  system={self.system},\n"
-            f"  debug={self.debug}\n"
-            f")"
-        )
+        buf = io.StringIO()
+        write = buf.write
+        write("Config(")
+        for i, (name, _) in enumerate(_SECTIONS):
+            write(",\n  " if i else "\n  ")
+            write(name)
+            write("=")
+            write(repr(getattr(self, name)))
+        write("\n)")
+        return buf.getvalue()
+
+
+def _from_section(cls, section: dict):
+    """
+    Build a config dataclass from its YAML section
+
+    Each field reads the key path given by _at()/_checked(), or its own
+    name; fields with a default may be left out of the YAML.
+
+    Args:
+        cls: Config dataclass type
+        section: Parsed YAML mapping for that section
+
+    Returns:
+        Instance of cls
+    """
+    values = {}
+    for name, key, has_default in _SECTION_KEYS[cls]:
+        node = section
+        try:
+            for part in key:
+                node = node[part]
+        except KeyError:
+            if has_default:
+                continue
+            raise
+        values[name] = node
+
+    return cls(**values)
 
 
 # Global config instance (loaded on import)
 _config: Optional[Config] = None
 
+# Last validated Config per resolved path, shared by all threads
+_config_cache: Dict[str, Config] = {}
+_config_lock = threading.Lock()
+
 
-def load_config(config_path: Optional[str] = None) -> Config:
+def load_config(config_path: Optional[str] = None, force: bool = False) -> Config:
     """
     Load or reload configuration
 
+    The parsed config is reused while the file's mtime and size are
+    unchanged, so repeated loads don't re-read and re-validate it.
+
     Args:
         config_path: Optional path to config file
+        force: Parse the file even if it looks unchanged
 
     Returns:
         Config object
     """
     global _config
-    _config = Config(config_path)
-    return _config
+    path = Path(config_path) if config_path is not None else DEFAULT_CONFIG_PATH
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    resolved = str(path.resolve())
+    key = (resolved, stat.st_mtime_ns, stat.st_size)
+
+    with _config_lock:
+        config = _config_cache.get(resolved)
+        if force or config is None or config._cache_key != key:
+            config = Config(resolved)
+            _config_cache[resolved] = config
+        _config = config
+
+    return config
 
 
 def get_config() -> Config:
@@ -467,9 +529,8 @@ def get_config() -> Config:
     Returns:
         Config object
     """
-    global _config
     if _config is None:
-        _config = Config()
+        return load_config()
     return _config
 
 
@@ -1,11 +1,32 @@
 """
 Hardware Abstraction Layer
 Provides unified interface for all hardware components
+
+Components are imported on first access, so code that needs only one of
+them (or none, e.g. a config check) doesn't pay for loading the rest.
 """
 
-from .led_matrix import LEDMatrix
-from .audio import AudioSystem
-from .camera import CameraSystem
-from .motion import MotionSensor
+import importlib
+
+# Public name -> submodule defining it
+_LAZY = {
+    'LEDMatrix': '.led_matrix',
+    'AudioSystem': '.audio',
+    'CameraSystem': '.camera',
+    'MotionSensor': '.motion',
+}
 
 __all__ = ['LEDMatrix', 'AudioSystem', 'CameraSystem', 'MotionSensor']
+
+
+def __getattr__(name: str):
+    """Import a component's module the first time the component is used"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
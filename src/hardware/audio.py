@@ -4,16 +4,191 @@ Text-to-speech output for caring personality
 """
 
 import logging
-from typing import Optional
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
+# TTS engines by backend. One engine is shared by every open AudioSystem,
+# since driver start-up is slow; the speech thread creates, drives and
+# stops it, as the engine must only be used from one thread.
+_engine_cache: Dict[str, Any] = {}
+_engine_users = 0  # Open AudioSystems using the engine
+_engine_lock = threading.Lock()
+
+# Speech jobs (audio system, rate, volume, utterances, done event) for the
+# speech thread; None tells it to stop the engine and exit
+_speech_queue: queue.Queue = queue.Queue()
+_speech_thread: Optional[threading.Thread] = None
+
+# Distinct (text, rate, volume) phrases kept as synthesized WAV
+_WAV_CACHE_SIZE = 64
+
+
+def _acquire_engine(backend: str = 'pyttsx3'):
+    """
+    Register a user of the shared TTS engine, starting the speech thread
+    (which creates the engine) for the first one
+
+    Raises:
+        Whatever the engine raised while starting up
+    """
+    global _engine_users, _speech_thread
+    with _engine_lock:
+        if _speech_thread is None:
+            ready = queue.Queue(maxsize=1)
+            thread = threading.Thread(target=_speech_worker, args=(backend, ready), daemon=True)
+            thread.start()
+            result = ready.get()
+            if isinstance(result, Exception):
+                raise result
+            _speech_thread = thread
+
+        _engine_users += 1
+        return _engine_cache[backend]
+
+
+def _release_engine():
+    """Drop one engine user; the last one shuts the speech thread down"""
+    global _engine_users, _speech_thread
+    with _engine_lock:
+        _engine_users -= 1
+        if _engine_users == 0 and _speech_thread is not None:
+            # Jobs of closed systems are skipped, so this only waits for
+            # the utterance playing now
+            _speech_queue.put(None)
+            _speech_thread.join()
+            _speech_thread = None
+
+
+@lru_cache(maxsize=_WAV_CACHE_SIZE)
+def _cached_wav(text: str, rate: int, volume: int) -> bytes:
+    """
+    Synthesize a phrase to WAV once; repeats are served from memory
+
+    Only called on the speech thread, which owns the engine.
+
+    Args:
+        text: Text to speak
+        rate: Speech rate in words per minute
+        volume: Volume level (0-100)
+
+    Returns:
+        WAV file contents
+    """
+    engine = _engine_cache['pyttsx3']
+    engine.setProperty('rate', rate)
+    engine.setProperty('volume', volume / 100.0)
+
+    fd, path = tempfile.mkstemp(suffix='.wav')
+    os.close(fd)
+    try:
+        engine.save_to_file(text, path)
+        engine.runAndWait()
+        with open(path, 'rb') as f:
+            data = f.read()
+    finally:
+        os.remove(path)
+
+    if not data:
+        raise RuntimeError("TTS engine wrote no audio")
+    return data
+
+
+def _play_wav(data: bytes):
+    """Play WAV bytes through ALSA, blocking until done"""
+    subprocess.run(['aplay', '-q', '-'], input=data, check=True)
+
+
+def _speech_worker(backend: str, ready: queue.Queue):
+    """
+    Speech thread: create the engine, play queued jobs one at a time,
+    then stop the engine when told to exit
+
+    Args:
+        backend: Engine name in _engine_cache
+        ready: Receives the engine, or the exception raised creating it
+    """
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+    except Exception as e:
+        ready.put(e)
+        return
+
+    _engine_cache[backend] = engine
+    ready.put(engine)
+
+    while True:
+        job = _speech_queue.get()
+        if job is None:
+            break
+
+        audio, base_rate, base_volume, utterances, done = job
+        if audio.engine is None:
+            done.set()  # System closed before its turn
+            continue
+
+        audio.speaking.set()
+        try:
+            # Single phrases at the default settings replay from the cache
+            if audio.voice_cache and len(utterances) == 1 and utterances[0][1:] == (None, None):
+                try:
+                    _play_wav(_cached_wav(utterances[0][0], base_rate, base_volume))
+                    continue
+                except (OSError, RuntimeError, subprocess.CalledProcessError) as e:
+                    logger.warning(f"Voice cache unavailable, synthesizing live: {e}")
+                    audio.voice_cache = False
+
+            # The engine is shared, so start from the settings at queue time
+            engine.setProperty('rate', base_rate)
+            engine.setProperty('volume', base_volume / 100.0)
+
+            for text, rate, volume in utterances:
+                if rate is not None:
+                    engine.setProperty('rate', rate)
+                if volume is not None:
+                    engine.setProperty('volume', max(0, min(100, volume)) / 100.0)
+                engine.say(text)
+
+            engine.runAndWait()
+
+        except Exception as e:
+            logger.error(f"Speech error: {e}")
+        finally:
+            audio.speaking.clear()
+            done.set()
+
+    try:
+        engine.stop()
+    except Exception:
+        pass
+    del _engine_cache[backend]
+
+
+def _queue_speech(audio: 'AudioSystem', utterances: list) -> threading.Event:
+    """
+    Hand utterances to the speech thread
+
+    The system's current rate and volume go with the job, so later
+    set_rate()/set_volume() calls don't change speech already queued.
+    """
+    done = threading.Event()
+    _speech_queue.put((audio, audio.rate, audio.volume, utterances, done))
+    return done
+
 
 class AudioSystem:
     """Text-to-speech audio output system"""
 
     def __init__(self, volume: int = 70, rate: int = 150,
-                 voice_enabled: bool = True, simulate: bool = False):
+                 voice_enabled: bool = True, simulate: bool = False,
+                 voice_cache: bool = False):
         """
         Initialize audio system
 
@@ -22,19 +197,21 @@ class AudioSystem:
             rate: Speech rate in words per minute
             voice_enabled: Enable voice output
             simulate: If True, print to console instead of speaking
+            voice_cache: Synthesize each distinct phrase to WAV once and
+                replay it with aplay afterwards (falls back to live speech
+                if that fails)
         """
         self.volume = volume
         self.rate = rate
         self.voice_enabled = voice_enabled
         self.simulate = simulate
+        self.voice_cache = voice_cache
         self.engine = None
+        self.speaking = threading.Event()  # Set while speech is playing
 
         if not simulate and voice_enabled:
             try:
-                import pyttsx3
-                self.engine = pyttsx3.init()
-                self.engine.setProperty('rate', rate)
-                self.engine.setProperty('volume', volume / 100.0)
+                self.engine = _acquire_engine('pyttsx3')
                 logger.info("Audio system initialized with pyttsx3")
 
             except Exception as e:
@@ -48,6 +225,9 @@ class AudioSystem:
         """
         Speak text aloud
 
+        Speech plays on a background thread, queued behind any earlier
+        speech; ``speaking`` is set while it plays.
+
         Args:
             text: Text to speak
             wait: If True, block until speech completes
@@ -59,44 +239,63 @@ class AudioSystem:
             print(f"\n[AUDIO] 🔊 '{text}'")
             return
 
-        try:
-            if wait:
-                self.engine.say(text)
-                self.engine.runAndWait()
-            else:
-                # Non-blocking speech
-                self.engine.say(text)
-                self.engine.startLoop(False)
-                self.engine.iterate()
-                self.engine.endLoop()
+        if self.engine is None:
+            return  # Closed
 
-        except Exception as e:
-            logger.error(f"Speech error: {e}")
+        done = _queue_speech(self, [(text, None, None)])
+        if wait:
+            done.wait()
+
+    def speak_batch(self, utterances: Iterable[Tuple[str, Optional[int], Optional[int]]],
+                    wait: bool = True):
+        """
+        Speak several utterances, each with its own rate and volume, in a
+        single engine run. pyttsx3 queues property changes in order with
+        the text, so this avoids a full runAndWait cycle per utterance.
+        Later speech starts from this system's rate and volume again.
+
+        Args:
+            utterances: Iterable of (text, rate, volume); None keeps the
+                current setting
+            wait: If True, block until speech completes
+        """
+        if not self.voice_enabled:
+            return
+
+        if self.simulate:
+            for text, rate, volume in utterances:
+                print(f"\n[AUDIO] 🔊 '{text}'")
+            return
+
+        if self.engine is None:
+            return  # Closed
+
+        done = _queue_speech(self, list(utterances))
+        if wait:
+            done.wait()
 
     def set_volume(self, volume: int):
         """
         Set volume level
 
+        Applies to speech queued after the call.
+
         Args:
             volume: 0-100
         """
         self.volume = max(0, min(100, volume))
 
-        if not self.simulate and self.engine:
-            self.engine.setProperty('volume', self.volume / 100.0)
-
     def set_rate(self, rate: int):
         """
         Set speech rate
 
+        Applies to speech queued after the call.
+
         Args:
             rate: Words per minute (typically 100-200)
         """
         self.rate = rate
 
-        if not self.simulate and self.engine:
-            self.engine.setProperty('rate', rate)
-
     def enable_voice(self, enabled: bool):
         """Enable or disable voice output"""
         self.voice_enabled = enabled
@@ -104,10 +303,9 @@ class AudioSystem:
     def close(self):
         """Clean up resources"""
         if self.engine:
-            try:
-                self.engine.stop()
-            except:
-                pass
+            # Shared engine: only the last open AudioSystem stops it
+            self.engine = None
+            _release_engine()
         logger.info("Audio system closed")
 
 
@@ -4,6 +4,9 @@ Pi Camera for behavioral monitoring
 """
 
 import logging
+import queue
+import threading
+import time
 import numpy as np
 from typing import Optional, Tuple
 
@@ -32,15 +35,48 @@ class CameraSystem:
         self.camera = None
         self.is_capturing = False
 
+        # Background capture: producer thread and its latest-frame slot
+        self._producer = None
+        self._frames = None
+        self._grabbed = None
+
+        # Simulated frames (set up below once simulation is decided)
+        self._rng = None
+        self._sim_noise = None
+        self._sim_buf = None
+
+        # Rotation left to do in software (the ISP may take over 180)
+        self._sw_rotation = rotation
+        self._cv2 = None
+        self._cv2_rotate_code = None
+
         if not simulate:
             try:
                 from picamera2 import Picamera2
                 self.Picamera2 = Picamera2
                 self.camera = Picamera2()
 
-                # Configure camera
-                config = self.camera.create_still_configuration(
-                    main={"size": resolution, "format": "RGB888"}
+                # Configure camera. Video mode streams into a ring of
+                # preallocated buffers instead of running the still-capture
+                # pipeline per frame. queue=False stops Picamera2 from
+                # holding a frame in reserve, so captures return the current
+                # sensor frame rather than a stale queued one.
+                options = {}
+                if rotation == 180:
+                    # The ISP can flip both axes for free; it can't do 90/270
+                    try:
+                        from libcamera import Transform
+                        options['transform'] = Transform(hflip=1, vflip=1)
+                        self._sw_rotation = 0
+                    except ImportError:
+                        pass
+
+                config = self.camera.create_video_configuration(
+                    main={"size": resolution, "format": "RGB888"},
+                    buffer_count=4,
+                    queue=False,
+                    controls={"FrameRate": framerate},
+                    **options
                 )
                 self.camera.configure(config)
 
@@ -55,68 +91,230 @@ class CameraSystem:
         else:
             logger.info("Camera system running in simulation mode")
 
-    def start(self):
-        """Start camera capture"""
         if self.simulate:
-            self.is_capturing = True
-            logger.info("Camera simulation started")
+            # Noise generated once, twice a frame long; each simulated frame
+            # copies a randomly offset window of it into one reused buffer
+            height, width = resolution[1], resolution[0]
+            self._rng = np.random.default_rng()
+            self._sim_buf = np.empty((height, width, 3), dtype=np.uint8)
+            self._sim_noise = self._rng.integers(0, 256, 2 * self._sim_buf.size, dtype=np.uint8)
+
+        # Frame delivery is picked once here, since rotation is fixed
+        self._deliver = self._deliver_unrotated
+        if self._sw_rotation:
+            # OpenCV's rotate is a blocked NEON transpose with a contiguous
+            # result; np.rot90 is the fallback
+            try:
+                import cv2
+                self._cv2 = cv2
+                self._cv2_rotate_code = {
+                    90: cv2.ROTATE_90_COUNTERCLOCKWISE,  # Same direction as np.rot90
+                    180: cv2.ROTATE_180,
+                    270: cv2.ROTATE_90_CLOCKWISE,
+                }[self._sw_rotation]
+                self._deliver = self._deliver_cv2
+            except ImportError:
+                self._deliver = self._deliver_rot90
+
+    def start(self, background: bool = False):
+        """
+        Start camera capture
+
+        Args:
+            background: Capture continuously on a producer thread that holds
+                only the freshest frame. capture_frame() then blocks just
+                until the first frame arrives, so callers need no fixed
+                warmup sleep. Off by default, since continuous capture costs
+                CPU that a periodic sampler doesn't need.
+        """
+        if self.is_capturing:
             return
 
-        try:
-            self.camera.start()
+        if self.simulate:
             self.is_capturing = True
-            logger.info("Camera capture started")
-        except Exception as e:
-            logger.error(f"Failed to start camera: {e}")
-            self.is_capturing = False
+            logger.info("Camera simulation started")
+        else:
+            try:
+                self.camera.start()
+                self.is_capturing = True
+                logger.info("Camera capture started")
+            except Exception as e:
+                logger.error(f"Failed to start camera: {e}")
+                self.is_capturing = False
+                return
+
+        if background:
+            self._frames = queue.Queue(maxsize=1)
+            self._producer = threading.Thread(target=self._produce_frames, daemon=True)
+            self._producer.start()
 
     def stop(self):
         """Stop camera capture"""
+        self.is_capturing = False
+
+        if self._producer is not None:
+            self._producer.join(timeout=2.0)
+            self._producer = None
+        self._frames = None
+        self._grabbed = None
+
         if self.simulate:
-            self.is_capturing = False
             return
 
         try:
             if self.camera:
                 self.camera.stop()
-            self.is_capturing = False
             logger.info("Camera capture stopped")
         except Exception as e:
             logger.error(f"Failed to stop camera: {e}")
 
-    def capture_frame(self) -> Optional[np.ndarray]:
+    def _read_raw(self, reuse: bool = False) -> np.ndarray:
         """
-        Capture a single frame
+        Read one unrotated frame from the camera (or the simulator)
+
+        Args:
+            reuse: The frame is consumed before the next read (copied into
+                ``out`` or rotated into a new array), so a simulated frame
+                may come from the shared buffer instead of a fresh copy
 
         Returns:
-            NumPy array (H, W, 3) in RGB format, or None on error
+            NumPy array (H, W, 3)
         """
-        if not self.is_capturing:
-            return None
-
         if self.simulate:
-            # Generate dummy frame for testing
-            height, width = self.resolution[1], self.resolution[0]
-            frame = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
-            return frame
+            size = self._sim_buf.size
+            start = int(self._rng.integers(size))
+            np.copyto(self._sim_buf.reshape(-1), self._sim_noise[start:start + size])
+            return self._sim_buf if reuse else self._sim_buf.copy()
 
+        # Copy the pixels out and hand the buffer straight back to the ring
+        request = self.camera.capture_request()
         try:
-            frame = self.camera.capture_array()
+            return request.make_array("main")
+        finally:
+            request.release()
+
+    def _produce_frames(self):
+        """Producer thread: keep the latest frame in the one-slot queue"""
+        period = 1.0 / self.framerate
+
+        while self.is_capturing:
+            try:
+                frame = self._read_raw()
+            except Exception as e:
+                logger.error(f"Background capture error: {e}")
+                time.sleep(period)
+                continue
+
+            # Drop any unread frame so only the freshest is held
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                pass
+            self._frames.put_nowait(frame)
 
-            # Apply rotation if needed
-            if self.rotation == 90:
-                frame = np.rot90(frame, k=1)
-            elif self.rotation == 180:
-                frame = np.rot90(frame, k=2)
-            elif self.rotation == 270:
-                frame = np.rot90(frame, k=3)
+            if self.simulate:
+                time.sleep(period)  # Real captures are paced by the sensor
 
+    def _deliver_unrotated(self, frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Hand over the frame, copying only into the caller's buffer"""
+        if out is None:
             return frame
+        np.copyto(out, frame)
+        return out
 
+    def _deliver_cv2(self, frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Rotate with OpenCV, into the caller's buffer if given"""
+        return self._cv2.rotate(frame, self._cv2_rotate_code, dst=out)
+
+    def _deliver_rot90(self, frame: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Rotate with NumPy, into the caller's buffer if given"""
+        frame = np.rot90(frame, k=self._sw_rotation // 90)
+        if out is None:
+            return np.ascontiguousarray(frame)
+        np.copyto(out, frame)
+        return out
+
+    def capture_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Capture a single frame
+
+        Args:
+            out: Optional preallocated (H, W, 3) uint8 array to write the
+                frame into, so callers in a capture loop can reuse one buffer
+
+        Returns:
+            NumPy array (H, W, 3) in RGB format (``out`` if given),
+            or None on error
+        """
+        if not self.is_capturing:
+            return None
+
+        try:
+            if self._frames is not None:
+                frame = self._frames.get(timeout=2.0)
+            else:
+                # Rotation always yields a new array, so only an unrotated
+                # frame without ``out`` needs its own copy
+                frame = self._read_raw(reuse=out is not None or bool(self._sw_rotation))
+
+            return self._deliver(frame, out)
+
+        except queue.Empty:
+            logger.error("Timed out waiting for a camera frame")
+            return None
         except Exception as e:
             logger.error(f"Frame capture error: {e}")
             return None
 
+    def grab(self) -> bool:
+        """
+        Wait for the next frame without copying or converting its pixels
+
+        Use with retrieve() when only some frames need to be inspected,
+        e.g. counting sensor frames for a frame-rate check.
+
+        Returns:
+            True if a frame was delivered
+        """
+        if not self.is_capturing:
+            return False
+
+        if self._frames is not None:
+            # Producer already read it; just take ownership
+            try:
+                self._grabbed = self._frames.get(timeout=2.0)
+                return True
+            except queue.Empty:
+                return False
+
+        if self.simulate:
+            return True
+
+        try:
+            # Blocks until the next frame completes; returns metadata only
+            self.camera.capture_metadata()
+            return True
+
+        except Exception as e:
+            logger.error(f"Frame grab error: {e}")
+            return False
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Fetch the pixels of the current frame (see grab())
+
+        Args:
+            out: Optional preallocated (H, W, 3) uint8 array to write into
+
+        Returns:
+            NumPy array (H, W, 3) in RGB format, or None on error
+        """
+        if self._grabbed is not None:
+            frame, self._grabbed = self._grabbed, None
+            return self._deliver(frame, out)
+
+        return self.capture_frame(out=out)
+
     def get_frame_size(self) -> Tuple[int, int]:
         """Get current frame size (width, height)"""
         if self.rotation in [90, 270]:
@@ -4,8 +4,9 @@ Controls 8x8 WS2812B RGB LED matrix for visual expressions
 """
 
 import time
-from typing import Optional, List
+from typing import Optional, List, Union
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,17 @@ class LEDMatrix:
         self.simulate = simulate
         self.current_pattern = None
 
+        # Precomputed strip index for each (x, y), assuming zigzag wiring
+        # (common for matrices): even rows run left to right, odd rows
+        # right to left
+        self._index_lut = tuple(
+            y * width + (x if y % 2 == 0 else width - 1 - x)
+            for y in range(height) for x in range(width)
+        )
+        # Inverse of the above: row-major pixel position for each strip index,
+        # so a whole frame can be reordered into strip order in one step
+        self._strip_order = np.argsort(self._index_lut)
+
         if not simulate:
             try:
                 from rpi_ws281x import PixelStrip, Color
@@ -84,48 +96,114 @@ class LEDMatrix:
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return
 
+        if self.simulate:
+            return  # Skip individual pixel updates in simulation
+
         # Convert 2D coordinates to 1D strip index
-        # Assuming zigzag wiring pattern (common for matrices)
-        if y % 2 == 0:
-            # Even rows go left to right
-            index = y * self.width + x
-        else:
-            # Odd rows go right to left
-            index = y * self.width + (self.width - 1 - x)
+        index = self._index_lut[y * self.width + x]
+        self.strip.setPixelColor(index, self.Color(r, g, b))
 
+    def set_region(self, x0: int, x1: int, y0: int, y1: int, rgb: tuple):
+        """
+        Set a rectangular block of pixels to one color (call show() to display)
+
+        Args:
+            x0, x1: Column range [x0, x1)
+            y0, y1: Row range [y0, y1)
+            rgb: (r, g, b) color
+        """
         if self.simulate:
             return  # Skip individual pixel updates in simulation
 
-        self.strip.setPixelColor(index, self.Color(r, g, b))
+        indices = np.asarray(self._index_lut).reshape(self.height, self.width)
+        color = self.Color(*rgb)
+        for index in indices[max(0, y0):y1, max(0, x0):x1].ravel().tolist():
+            self.strip.setPixelColor(index, color)
 
-    def show_pattern(self, pattern: List[List[tuple]], palette: Optional[dict] = None):
+    def set_pixels(self, coords, rgb: tuple):
+        """
+        Set several pixels to one color (call show() to display)
+
+        Args:
+            coords: Iterable of (x, y) coordinates; out-of-range ones are skipped
+            rgb: (r, g, b) color
+        """
+        if self.simulate:
+            return  # Skip individual pixel updates in simulation
+
+        color = self.Color(*rgb)
+        for x, y in coords:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.strip.setPixelColor(self._index_lut[y * self.width + x], color)
+
+    def show(self):
+        """Push pending pixel updates to the matrix"""
+        if not self.simulate:
+            self.strip.show()
+
+    def show_pattern(self, pattern: Union[List[List[tuple]], np.ndarray],
+                     palette: Optional[dict] = None):
         """
         Display an 8x8 pattern on the matrix
 
         Args:
-            pattern: 8x8 list of RGB tuples or integers (if palette provided)
+            pattern: 8x8 list of RGB tuples or integers (if palette provided),
+                or an (8, 8, 3) uint8 RGB array
             palette: Optional color palette mapping integers to RGB tuples
         """
         self.current_pattern = pattern
 
-        for y in range(self.height):
-            for x in range(self.width):
-                pixel = pattern[y][x]
+        if self.simulate:
+            self._visualize_console(pattern, palette)
+            return
 
-                # Apply palette if provided and pixel is an integer
-                if palette is not None and isinstance(pixel, int):
-                    r, g, b = palette.get(pixel, (0, 0, 0))
-                elif isinstance(pixel, tuple) and len(pixel) == 3:
-                    r, g, b = pixel
-                else:
-                    r, g, b = 0, 0, 0
+        if isinstance(pattern, np.ndarray):
+            rgb = pattern.reshape(-1, 3).astype(np.uint32)
+        else:
+            rgb = np.array([
+                self._resolve_color(pattern[y][x], palette)
+                for y in range(self.height) for x in range(self.width)
+            ], dtype=np.uint32)
+
+        # Pack every pixel into a 24-bit color word in one pass,
+        # matching Color(r, g, b)
+        packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+        self._write_packed(packed)
+
+    def push_raw(self, frame: np.ndarray):
+        """
+        Display a precomputed frame with no per-pixel Python work
 
-                self.set_pixel(x, y, r, g, b)
+        Intended for animations whose frames are built ahead of time.
+        Unlike show_pattern(), it doesn't record the current pattern.
 
+        Args:
+            frame: (8, 8, 3) uint8 RGB array
+        """
         if self.simulate:
-            self._visualize_console(pattern, palette)
-        else:
-            self.strip.show()
+            self._visualize_console(frame)
+            return
+
+        rgb = frame.reshape(-1, 3).astype(np.uint32)
+        self._write_packed((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2])
+
+    def _write_packed(self, packed: np.ndarray):
+        """Copy row-major packed colors into the LED buffer and transmit"""
+        # Bulk-assign the whole buffer in strip order instead of one
+        # setPixelColor() call per LED
+        self.strip.getPixels()[:] = packed[self._strip_order].tolist()
+        self.strip.show()
+
+    @staticmethod
+    def _resolve_color(pixel, palette: Optional[dict]) -> tuple:
+        """Resolve a pattern pixel to an RGB tuple"""
+        # Apply palette if provided and pixel is an integer
+        if palette is not None and isinstance(pixel, int):
+            return palette.get(pixel, (0, 0, 0))
+        elif isinstance(pixel, tuple) and len(pixel) == 3:
+            return pixel
+        return (0, 0, 0)
 
     def _visualize_console(self, pattern: List[List], palette: Optional[dict] = None):
         """Print pattern to console for debugging"""
@@ -137,9 +215,9 @@ class LEDMatrix:
             for pixel in row:
                 if isinstance(pixel, int):
                     line += chars.get(pixel, '?')
-                elif isinstance(pixel, tuple):
+                elif isinstance(pixel, (tuple, np.ndarray)):
                     # Show intensity based on brightness
-                    brightness = sum(pixel)
+                    brightness = sum(int(c) for c in pixel)
                     if brightness == 0:
                         line += ' '
                     elif brightness < 50:
@@ -156,6 +156,44 @@ class MotionSensor:
             logger.error(f"Error waiting for motion: {e}")
             return False
 
+    def wait_for_edge(self, timeout: float) -> bool:
+        """
+        Block until motion starts (rising edge) or the timeout expires
+
+        Waits on a GPIO edge interrupt rather than polling, so idle time
+        costs no CPU and detection isn't delayed by a poll interval.
+        Simulation mode polls is_motion_detected() instead.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if motion started, False on timeout
+        """
+        if not self.enabled:
+            return False
+
+        if self.simulate:
+            deadline = time.time() + timeout
+            while True:
+                if self.is_motion_detected():
+                    return True
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(0.1, remaining))
+
+        try:
+            channel = self.GPIO.wait_for_edge(
+                self.gpio_pin, self.GPIO.RISING,
+                timeout=max(1, int(timeout * 1000))
+            )
+            return channel is not None
+
+        except Exception as e:
+            logger.error(f"Error waiting for motion edge: {e}")
+            return False
+
     def enable(self, enabled: bool):
         """Enable or disable motion detection"""
         self.enabled = enabled
@@ -58,7 +58,10 @@ class PixelPlant:
         self.behavior = BehaviorMonitor(
             pose_detection_enabled=self.config.ai.pose_detection_enabled,
             confidence_threshold=self.config.ai.confidence_threshold,
-            simulate=self.config.debug.simulate_hardware
+            simulate=self.config.debug.simulate_hardware,
+            pose_backend=self.config.ai.pose_backend,
+            model_path=self.config.ai.model_path,
+            pause_event=self.audio.speaking  # No inference while talking
         )
 
         self.learner = PatternLearner(
@@ -90,7 +93,8 @@ class PixelPlant:
             volume=self.config.hardware.audio_volume,
             rate=self.config.personality.voice_rate,
             voice_enabled=self.config.personality.voice_enabled,
-            simulate=simulate
+            simulate=simulate,
+            voice_cache=self.config.personality.voice_cache_enabled
         )
 
         self.camera = CameraSystem(
@@ -138,6 +142,8 @@ class PixelPlant:
 
         # Save learned patterns
         self.learner.save_patterns()
+        self.learner.close()
+        self.behavior.close()
 
         # Cleanup hardware
         self.led.close()
@@ -105,7 +105,10 @@ class PixelPlant:
         self.behavior = BehaviorMonitor(
             pose_detection_enabled=self.config.ai.pose_detection_enabled,
             confidence_threshold=self.config.ai.confidence_threshold,
-            simulate=self.config.debug.simulate_hardware
+            simulate=self.config.debug.simulate_hardware,
+            pose_backend=self.config.ai.pose_backend,
+            model_path=self.config.ai.model_path,
+            pause_event=self.audio.speaking  # No inference while talking
         )
 
         self.learner = PatternLearner(
@@ -138,7 +141,7 @@ class PixelPlant:
         sitting_start_str = self.state_manager.get('sitting_start')
         if sitting_start_str:
             try:
-                self.behavior.sitting_start = datetime.fromisoformat(sitting_start_str)
+                self.behavior.restore_sitting_start(datetime.fromisoformat(sitting_start_str))
             except (ValueError, TypeError):
                 pass
 
@@ -160,7 +163,8 @@ class PixelPlant:
             volume=self.config.hardware.audio_volume,
             rate=self.config.personality.voice_rate,
             voice_enabled=self.config.personality.voice_enabled,
-            simulate=simulate
+            simulate=simulate,
+            voice_cache=self.config.personality.voice_cache_enabled
         )
 
         self.camera = CameraSystem(
@@ -271,6 +275,8 @@ class PixelPlant:
 
         # Save learned patterns
         self.learner.save_patterns()
+        self.learner.close()
+        self.behavior.close()
 
         # Shutdown state manager (marks clean shutdown)
         self.state_manager.shutdown(clean=True)
@@ -466,14 +472,15 @@ class PixelPlant:
 
     def _save_current_state(self):
         """Save current application state"""
+        sitting_start = self.behavior.get_sitting_start()
         self.state_manager.update(
             current_mood=self.mood.current_mood.value,
             concern_level=self.mood.concern_level,
             is_sleeping=(self.power_manager.current_state != PowerState.ACTIVE),
-            sitting_start=self.behavior.sitting_start.isoformat() if self.behavior.sitting_start else None,
-            total_sitting_seconds=self.behavior.total_sitting_time.total_seconds(),
-            total_standing_seconds=self.behavior.total_standing_time.total_seconds(),
-            total_moving_seconds=self.behavior.total_moving_time.total_seconds(),
+            sitting_start=sitting_start.isoformat() if sitting_start else None,
+            total_sitting_seconds=self.behavior.total_sitting_time,
+            total_standing_seconds=self.behavior.total_standing_time,
+            total_moving_seconds=self.behavior.total_moving_time,
             last_seen=datetime.now().isoformat(),
         )
 
@@ -13,6 +13,11 @@ Animation Styles:
 import time
 import copy
 
+try:
+    from .pixel_art import render_pattern_row
+except ImportError:  # Run as a script
+    from pixel_art import render_pattern_row
+
 
 class PixelAnimator:
     """Handles rise and fall animations for 8x8 LED matrix patterns."""
@@ -245,11 +250,7 @@ def visualize_pattern_console(pattern, palette=None, clear_screen=True):
     if clear_screen:
         print('\033[2J\033[H', end='')  # Clear screen and move cursor to top
 
-    # ASCII characters for visualization
-    chars = {0: ' ', 1: '█', 2: '▓', 3: '░'}
-
-    for row in pattern:
-        print(''.join(chars.get(p, '?') for p in row))
+    print('\n'.join(render_pattern_row(row) for row in pattern))
 
     if palette:
         print(f"\n[{palette}]")
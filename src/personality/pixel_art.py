@@ -336,6 +336,19 @@ def get_colored_pattern(pattern, palette):
     return colored
 
 
+# Console characters indexed by pixel value (0-3)
+PIXEL_CHARS = (' ', '█', '▓', '░')
+
+# str.translate table from pixel values (as code points) to PIXEL_CHARS,
+# for rows decoded with bytes(row).decode('latin1')
+CONSOLE_CHARS = str.maketrans({chr(value): char for value, char in enumerate(PIXEL_CHARS)})
+
+
+def render_pattern_row(row):
+    """Render one pattern row as console characters ('?' for unknown values)."""
+    return ''.join(PIXEL_CHARS[p] if 0 <= p < 4 else '?' for p in row)
+
+
 def visualize_pattern(pattern, palette=None):
     """
     Print a text visualization of the pattern.
@@ -347,9 +360,7 @@ def visualize_pattern(pattern, palette=None):
     """
     if palette is None:
         # Use ASCII characters for visualization
-        chars = {0: ' ', 1: '█', 2: '▓', 3: '░'}
-        for row in pattern:
-            print(''.join(chars.get(p, '?') for p in row))
+        print('\n'.join(render_pattern_row(row) for row in pattern))
     else:
         # Show RGB values
         for row in pattern: